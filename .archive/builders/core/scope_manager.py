@@ -30,6 +30,7 @@ Example Usage:
     ...     print(f"{scope.type.value}: {scope.path} (precedence: {scope.precedence})")
 """
 
+import sys
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -55,10 +56,31 @@ class ScopeType(Enum):
     LOCAL = "local"
 
 
-@dataclass
+# Shared directory/file names; class constants below alias these
+_CLAUDE_DIR = sys.intern(".claude")
+_LOCAL_SETTINGS = sys.intern("settings.local.json")
+
+# Accepted CLI flag values and the matching error hint, built once at import
+_VALID_FLAGS = frozenset(e.value for e in ScopeType)
+_VALID_FLAGS_MSG = ", ".join("--" + e.value for e in ScopeType)
+
+# Precedence order (1=highest) and lookup-failure messages per scope
+_SCOPE_PRECEDENCE = {ScopeType.LOCAL: 1, ScopeType.PROJECT: 2, ScopeType.GLOBAL: 3}
+_SCOPE_NOT_FOUND_MSG = {
+    ScopeType.PROJECT: (
+        "Cannot determine project scope: no .claude/ directory found in "
+        "current directory or parents"
+    ),
+    ScopeType.LOCAL: "Cannot determine local scope: no project root found for local settings",
+}
+
+
+@dataclass(slots=True, frozen=True)
 class ScopeConfig:
     """Configuration metadata for a scope.
 
+    Instances are immutable and hashable, so they can be used as cache keys.
+
     Attributes:
         path: Path to the scope directory or file
         type: Type of scope (GLOBAL, PROJECT, or LOCAL)
@@ -83,10 +105,10 @@ class ScopeManager:
     """
 
     # Class constants
-    GLOBAL_DIR_NAME = ".claude"
-    PROJECT_DIR_NAME = ".claude"
-    LOCAL_FILE_NAME = "settings.local.json"
-    PROJECT_MARKERS = [".git", ".claude"]
+    GLOBAL_DIR_NAME = _CLAUDE_DIR
+    PROJECT_DIR_NAME = _CLAUDE_DIR
+    LOCAL_FILE_NAME = _LOCAL_SETTINGS
+    PROJECT_MARKERS = frozenset({".git", _CLAUDE_DIR})
 
     def __init__(self, cwd: Optional[Path] = None) -> None:
         """Initialize the ScopeManager.
@@ -142,7 +164,7 @@ class ScopeManager:
             >>> print(global_path)
             PosixPath('/home/user/.claude')
         """
-        return (Path.home() / self.GLOBAL_DIR_NAME).resolve()
+        return (Path.home() / _CLAUDE_DIR).resolve()
 
     def get_project_path(self) -> Optional[Path]:
         """Find the nearest project scope path (.claude/ in current or parent dirs).
@@ -163,7 +185,7 @@ class ScopeManager:
         if not project_root:
             return None
 
-        project_claude_dir = project_root / self.PROJECT_DIR_NAME
+        project_claude_dir = project_root / _CLAUDE_DIR
         if project_claude_dir.exists() and project_claude_dir.is_dir():
             return project_claude_dir.resolve()
 
@@ -185,7 +207,7 @@ class ScopeManager:
         if not project_path:
             return None
 
-        return (project_path / self.LOCAL_FILE_NAME).resolve()
+        return self._local_path_for(project_path)
 
     def find_project_root(self) -> Optional[Path]:
         """Locate the project root directory.
@@ -203,24 +225,18 @@ class ScopeManager:
             PosixPath('/home/user/project')
         """
         current = self.cwd
-        root = Path(current.root)
-
-        # Traverse upward looking for project markers
-        while current != root:
-            for marker in self.PROJECT_MARKERS:
-                marker_path = current / marker
-                if marker_path.exists():
-                    return current.resolve()
 
-            # Move to parent directory
-            current = current.parent
+        # Traverse upward looking for project markers, including the filesystem root
+        while True:
+            # any() stops at the first marker found, skipping remaining stat calls
+            if any((current / marker).exists() for marker in self.PROJECT_MARKERS):
+                return current.resolve()
 
-        # Check root directory as well
-        for marker in self.PROJECT_MARKERS:
-            if (root / marker).exists():
-                return root.resolve()
-
-        return None
+            # Move to parent directory; the root is its own parent
+            parent = current.parent
+            if parent == current:
+                return None
+            current = parent
 
     def resolve_all_scopes(self) -> List[ScopeConfig]:
         """Resolve all applicable scopes with correct precedence.
@@ -241,9 +257,11 @@ class ScopeManager:
         """
         scopes: List[ScopeConfig] = []
 
-        # Local scope (precedence 1)
-        local_path = self.get_local_path()
-        if local_path:
+        # Walk up to the project root once; local scope is derived from it
+        project_path = self.get_project_path()
+        if project_path:
+            # Local scope (precedence 1)
+            local_path = self._local_path_for(project_path)
             scopes.append(
                 ScopeConfig(
                     path=local_path,
@@ -253,15 +271,13 @@ class ScopeManager:
                 )
             )
 
-        # Project scope (precedence 2)
-        project_path = self.get_project_path()
-        if project_path:
+            # Project scope (precedence 2); get_project_path already confirmed the directory
             scopes.append(
                 ScopeConfig(
                     path=project_path,
                     type=ScopeType.PROJECT,
                     precedence=2,
-                    exists=project_path.exists(),
+                    exists=True,
                 )
             )
 
@@ -304,15 +320,16 @@ class ScopeManager:
             scope_type = self.detect_scope()
             return self._get_scope_config(scope_type)
 
-        # Normalize flag (remove leading dashes)
-        normalized_flag = flag.lstrip("-").lower()
+        # Normalize flag (remove leading dashes); skip when already canonical
+        if flag in _VALID_FLAGS:
+            normalized_flag = flag
+        else:
+            normalized_flag = flag.lstrip("-").lower()
 
         # Validate flag
-        valid_flags = {e.value for e in ScopeType}
-        if normalized_flag not in valid_flags:
+        if normalized_flag not in _VALID_FLAGS:
             raise InvalidScopeError(
-                f"Invalid scope flag: '{flag}'. Must be one of: "
-                f"{', '.join('--' + f for f in valid_flags)}"
+                f"Invalid scope flag: '{flag}'. Must be one of: {_VALID_FLAGS_MSG}"
             )
 
         # Convert flag to ScopeType
@@ -348,6 +365,17 @@ class ScopeManager:
         scope_config = self._get_scope_config(scope_type)
         return scope_config.exists
 
+    def _local_path_for(self, project_path: Path) -> Path:
+        """Internal helper to build the local settings path from a project .claude/ path.
+
+        Args:
+            project_path: Resolved path to the project .claude/ directory
+
+        Returns:
+            Path: Resolved path to settings.local.json inside the project scope
+        """
+        return (project_path / _LOCAL_SETTINGS).resolve()
+
     def _get_scope_config(self, scope_type: ScopeType) -> ScopeConfig:
         """Internal helper to get scope configuration for a given type.
 
@@ -360,35 +388,25 @@ class ScopeManager:
         Raises:
             ScopeNotFoundError: If project/local scope cannot be determined
         """
-        if scope_type == ScopeType.GLOBAL:
-            global_path = self.get_global_path()
-            return ScopeConfig(
-                path=global_path, type=scope_type, precedence=3, exists=global_path.exists()
-            )
-
-        elif scope_type == ScopeType.PROJECT:
-            project_path: Optional[Path] = self.get_project_path()
-            if project_path is None:
-                raise ScopeNotFoundError(
-                    "Cannot determine project scope: no .claude/ directory found in "
-                    "current directory or parents"
-                )
-            return ScopeConfig(
-                path=project_path, type=scope_type, precedence=2, exists=project_path.exists()
-            )
+        getter = {
+            ScopeType.GLOBAL: self.get_global_path,
+            ScopeType.PROJECT: self.get_project_path,
+            ScopeType.LOCAL: self.get_local_path,
+        }.get(scope_type)
+        if getter is None:
+            raise InvalidScopeError(f"Unknown scope type: {scope_type}")
 
-        elif scope_type == ScopeType.LOCAL:
-            local_path: Optional[Path] = self.get_local_path()
-            if local_path is None:
-                raise ScopeNotFoundError(
-                    "Cannot determine local scope: no project root found for local settings"
-                )
-            return ScopeConfig(
-                path=local_path, type=scope_type, precedence=1, exists=local_path.exists()
-            )
+        path: Optional[Path] = getter()
+        if path is None:
+            # Only project/local lookups can fail; global always resolves
+            raise ScopeNotFoundError(_SCOPE_NOT_FOUND_MSG[scope_type])
 
-        else:
-            raise InvalidScopeError(f"Unknown scope type: {scope_type}")
+        return ScopeConfig(
+            path=path,
+            type=scope_type,
+            precedence=_SCOPE_PRECEDENCE[scope_type],
+            exists=path.exists(),
+        )
 
 
 # Public API for easy imports
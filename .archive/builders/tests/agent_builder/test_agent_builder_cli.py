@@ -0,0 +1,276 @@
+"""CLI tests for agent_builder.
+
+Tests the catalog-facing commands (list, search, stats, delete) and validate.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.tools.agent_builder.catalog import CatalogManager
+from src.tools.agent_builder.main import cli
+from src.tools.agent_builder.models import AgentCatalogEntry, ModelType, ScopeType
+
+
+@pytest.fixture
+def project_with_agents(temp_project_root):
+    """Project root whose agents.json holds two project-scope agents."""
+    catalog = CatalogManager(temp_project_root / "agents.json")
+    agents_dir = temp_project_root / ".claude" / "agents"
+
+    for name, model in [("plan-agent", ModelType.SONNET), ("review-agent", ModelType.HAIKU)]:
+        agent_file = agents_dir / f"{name}.md"
+        agent_file.write_text(f"---\nname: {name}\n---\n")
+        catalog.add_agent(
+            AgentCatalogEntry(
+                name=name,
+                description=f"{name} description. Use when testing.",
+                scope=ScopeType.PROJECT,
+                model=model,
+                path=agent_file,
+                metadata={"template": "basic"},
+            )
+        )
+
+    return temp_project_root
+
+
+class TestStartup:
+    """Tests for CLI import cost."""
+
+    def test_main_does_not_import_wizard(self):
+        """Test importing the CLI leaves the wizard and questionary unloaded."""
+        code = (
+            "import sys, src.tools.agent_builder.main as main; "
+            "print('questionary' in sys.modules, 'src.tools.agent_builder.wizard' in sys.modules); "
+            "print(main.AgentWizard.__name__)"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+        )
+
+        assert result.stdout.split("\n")[:2] == ["False False", "AgentWizard"]
+
+    def test_wizard_defers_questionary(self):
+        """Test importing the wizard module leaves questionary unloaded."""
+        code = (
+            "import sys, src.tools.agent_builder.wizard as wizard; "
+            "print('questionary' in sys.modules); "
+            "wizard.CUSTOM_STYLE; print('questionary' in sys.modules)"
+        )
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+        )
+
+        assert result.stdout.split() == ["False", "True"]
+
+
+class TestCatalogReuse:
+    """Tests for sharing CatalogManager instances through the click context."""
+
+    def test_commands_share_catalog_manager(self, cli_runner, project_with_agents):
+        """Test commands run with the same obj reuse one CatalogManager."""
+        obj = {}
+        root = str(project_with_agents)
+
+        result = cli_runner.invoke(cli, ["list", "--project-root", root], obj=obj)
+        assert result.exit_code == 0
+        managers = dict(obj["catalogs"])
+        assert len(managers) == 1
+
+        result = cli_runner.invoke(cli, ["stats", "--project-root", root], obj=obj)
+        assert result.exit_code == 0
+        assert obj["catalogs"] == managers
+
+    def test_shared_manager_sees_deletes(self, cli_runner, project_with_agents):
+        """Test a shared manager reflects changes made by earlier commands."""
+        obj = {}
+        root = str(project_with_agents)
+
+        result = cli_runner.invoke(
+            cli, ["delete", "plan-agent", "--yes", "--project-root", root], obj=obj
+        )
+        assert result.exit_code == 0
+
+        result = cli_runner.invoke(cli, ["list", "--project-root", root], obj=obj)
+        assert result.exit_code == 0
+        assert "plan-agent" not in result.output
+        assert "review-agent" in result.output
+
+
+class TestListCommand:
+    """Tests for 'agent-builder list' command."""
+
+    def test_list_shows_agents(self, cli_runner, project_with_agents):
+        """Test list prints every agent."""
+        result = cli_runner.invoke(cli, ["list", "--project-root", str(project_with_agents)])
+
+        assert result.exit_code == 0
+        assert "Agents (2 total)" in result.output
+        assert "plan-agent" in result.output
+        assert "review-agent" in result.output
+
+    def test_list_filters_by_model(self, cli_runner, project_with_agents):
+        """Test list --model only shows matching agents."""
+        result = cli_runner.invoke(
+            cli, ["list", "--model", "haiku", "--project-root", str(project_with_agents)]
+        )
+
+        assert result.exit_code == 0
+        assert "review-agent" in result.output
+        assert "plan-agent" not in result.output
+        assert "model=haiku" in result.output
+
+
+class TestSearchCommand:
+    """Tests for 'agent-builder search' command."""
+
+    def test_search_finds_agent(self, cli_runner, project_with_agents):
+        """Test search prints matching agents."""
+        result = cli_runner.invoke(
+            cli, ["search", "review", "--project-root", str(project_with_agents)]
+        )
+
+        assert result.exit_code == 0
+        assert "(1 found)" in result.output
+        assert "review-agent" in result.output
+
+    def test_search_no_results(self, cli_runner, project_with_agents):
+        """Test search reports when nothing matches."""
+        result = cli_runner.invoke(
+            cli, ["search", "zzz", "--project-root", str(project_with_agents)]
+        )
+
+        assert result.exit_code == 0
+        assert "No agents found" in result.output
+
+
+class TestStatsCommand:
+    """Tests for 'agent-builder stats' command."""
+
+    def test_stats_counts(self, cli_runner, project_with_agents):
+        """Test stats prints totals and per-model counts."""
+        result = cli_runner.invoke(cli, ["stats", "--project-root", str(project_with_agents)])
+
+        assert result.exit_code == 0
+        assert "Total agents: 2" in result.output
+        assert "Project: 2" in result.output
+        assert "Haiku: 1" in result.output
+        assert "Sonnet: 1" in result.output
+
+
+class TestDeleteCommand:
+    """Tests for 'agent-builder delete' command."""
+
+    def test_delete_removes_file_and_entry(self, cli_runner, project_with_agents):
+        """Test delete removes the agent file and its catalog entry."""
+        agent_file = project_with_agents / ".claude" / "agents" / "plan-agent.md"
+
+        result = cli_runner.invoke(
+            cli, ["delete", "plan-agent", "--yes", "--project-root", str(project_with_agents)]
+        )
+
+        assert result.exit_code == 0
+        assert "deleted successfully" in result.output
+        assert not agent_file.exists()
+        catalog = CatalogManager(project_with_agents / "agents.json")
+        assert catalog.get_agent(name="plan-agent") is None
+
+    def test_delete_unknown_agent(self, cli_runner, project_with_agents):
+        """Test delete aborts for an agent that is not in the catalog."""
+        result = cli_runner.invoke(
+            cli, ["delete", "missing-agent", "--yes", "--project-root", str(project_with_agents)]
+        )
+
+        assert result.exit_code != 0
+        assert "not found" in result.output
+
+
+class TestValidateCommand:
+    """Tests for 'agent-builder validate' command."""
+
+    def test_validate_valid_file(self, cli_runner, tmp_path, sample_agent_md_content):
+        """Test a well-formed agent file validates."""
+        agent_file = tmp_path / "test-agent.md"
+        agent_file.write_text(sample_agent_md_content)
+
+        result = cli_runner.invoke(cli, ["validate", str(agent_file)])
+
+        assert result.exit_code == 0
+        assert "is valid" in result.output
+        assert "Name:        test-agent" in result.output
+
+    def test_validate_long_frontmatter(self, cli_runner, tmp_path):
+        """Test frontmatter longer than one read chunk is parsed in full."""
+        from src.tools.agent_builder.catalog import FRONTMATTER_HEAD_BYTES
+
+        description = "Use when testing. " + "x" * FRONTMATTER_HEAD_BYTES
+        agent_file = tmp_path / "long-agent.md"
+        agent_file.write_text(
+            f"---\nname: long-agent\ndescription: {description}\n"
+            "model: claude-3-5-sonnet-20241022\n---\n# Body\n---\n"
+        )
+
+        result = cli_runner.invoke(cli, ["validate", str(agent_file)])
+
+        assert result.exit_code != 0
+        assert "Invalid description" in result.output
+
+    def test_validate_unterminated_frontmatter(self, cli_runner, tmp_path):
+        """Test frontmatter without a closing delimiter is rejected."""
+        agent_file = tmp_path / "broken.md"
+        agent_file.write_text("---\nname: broken\n# Body\n")
+
+        result = cli_runner.invoke(cli, ["validate", str(agent_file)])
+
+        assert result.exit_code != 0
+        assert "Invalid frontmatter format" in result.output
+
+    def test_validate_missing_fields(self, cli_runner, tmp_path):
+        """Test frontmatter missing required fields is rejected."""
+        agent_file = tmp_path / "partial.md"
+        agent_file.write_text("---\nname: partial\n---\n")
+
+        result = cli_runner.invoke(cli, ["validate", str(agent_file)])
+
+        assert result.exit_code != 0
+        assert "Missing required fields: description, model" in result.output
+
+    def test_validate_multiple_files(self, cli_runner, tmp_path, sample_agent_md_content):
+        """Test several files are validated in one run with a summary."""
+        good = tmp_path / "test-agent.md"
+        good.write_text(sample_agent_md_content)
+        bad = tmp_path / "partial.md"
+        bad.write_text("---\nname: partial\n---\n")
+
+        result = cli_runner.invoke(cli, ["validate", str(good), str(bad)])
+
+        assert result.exit_code != 0
+        assert "'test-agent.md' is valid" in result.output
+        assert f"{bad}: Missing required fields" in result.output
+        assert "1 valid, 1 invalid" in result.output
+
+    def test_validate_glob(self, cli_runner, tmp_path, sample_agent_md_content):
+        """Test --glob expands recursively and all-valid runs exit cleanly."""
+        for name in ("one", "nested/two"):
+            agent_file = tmp_path / f"{name}.md"
+            agent_file.parent.mkdir(exist_ok=True)
+            agent_file.write_text(sample_agent_md_content)
+
+        result = cli_runner.invoke(cli, ["validate", "--glob", str(tmp_path / "**" / "*.md")])
+
+        assert result.exit_code == 0
+        assert "2 valid, 0 invalid" in result.output
+
+    def test_validate_nothing_matched(self, cli_runner, tmp_path):
+        """Test a glob matching no files is an error."""
+        result = cli_runner.invoke(cli, ["validate", "--glob", str(tmp_path / "*.md")])
+
+        assert result.exit_code != 0
+        assert "No agent files to validate" in result.output
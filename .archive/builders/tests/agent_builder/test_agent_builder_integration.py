@@ -35,7 +35,7 @@ class TestEndToEndWorkflow:
         catalog.add_agent(entry)
 
         # Verify creation
-        assert entry.path.exists()
+        assert entry.path_obj.exists()
         assert entry.name == "test-agent"
 
         # Step 2: List agents
@@ -56,7 +56,7 @@ class TestEndToEndWorkflow:
         # Step 5: Delete agent
         success = builder.delete_agent(entry.id)
         assert success is True
-        assert not entry.path.exists()
+        assert not entry.path_obj.exists()
 
         # Also remove from catalog manager
         catalog.remove_agent(entry.id)
@@ -69,7 +69,7 @@ class TestAgentCreation:
         result = builder.create_agent(sample_agent_config)
 
         # Verify file exists
-        agent_file = result.path
+        agent_file = result.path_obj
         assert agent_file.exists()
         assert agent_file.is_file()
         assert agent_file.suffix == ".md"
@@ -82,7 +82,7 @@ class TestAgentCreation:
         result = builder.create_agent(sample_agent_config_with_content)
 
         # Read file and verify custom content
-        content = result.path.read_text()
+        content = result.path_obj.read_text()
         assert "# Custom Agent" in content
         assert "This is custom content." in content
 
@@ -94,7 +94,7 @@ class TestAgentCreation:
         result = builder.create_agent(sample_agent_config_with_frontmatter)
 
         # Read file and verify frontmatter
-        content = result.path.read_text()
+        content = result.path_obj.read_text()
         assert "version: '1.0'" in content or 'version: "1.0"' in content
         assert "- planning" in content
         assert "- architecture" in content
@@ -108,9 +108,16 @@ class TestAgentCreation:
         assert isinstance(result.id, UUID)
         assert result.created_at is not None
         assert result.updated_at is not None
-        assert result.path.is_absolute()
+        assert result.path_obj.is_absolute()
         assert "template" in result.metadata
 
+    def test_create_agent_uses_single_timestamp(self, temp_agent_dir, sample_agent_config):
+        """Test that created_at and updated_at are identical for a new agent."""
+        builder = AgentBuilder(base_dir=temp_agent_dir)
+        result = builder.create_agent(sample_agent_config)
+
+        assert result.created_at == result.updated_at
+
     def test_create_agent_with_invalid_name(self, temp_agent_dir):
         """Test that invalid agent names are rejected."""
         builder = AgentBuilder(base_dir=temp_agent_dir)
@@ -144,7 +151,7 @@ class TestAgentFileContent:
         builder = AgentBuilder(base_dir=temp_agent_dir)
         result = builder.create_agent(sample_agent_config)
 
-        content = result.path.read_text()
+        content = result.path_obj.read_text()
         assert content.startswith("---\n")
         assert "name: plan-agent" in content
         assert "model: claude-3-5-sonnet-20241022" in content
@@ -154,7 +161,7 @@ class TestAgentFileContent:
         builder = AgentBuilder(base_dir=temp_agent_dir)
         result = builder.create_agent(sample_agent_config)
 
-        content = result.path.read_text()
+        content = result.path_obj.read_text()
         assert sample_agent_config.description in content
 
     def test_agent_file_well_formatted(self, temp_agent_dir, sample_agent_config):
@@ -162,7 +169,7 @@ class TestAgentFileContent:
         builder = AgentBuilder(base_dir=temp_agent_dir)
         result = builder.create_agent(sample_agent_config)
 
-        content = result.path.read_text()
+        content = result.path_obj.read_text()
 
         # Check for markdown headers
         assert "# " in content
@@ -227,7 +234,7 @@ class TestSecurityValidation:
         result = builder.create_agent(sample_agent_config)
 
         # Verify path is within base_dir
-        assert result.path.resolve().is_relative_to(temp_agent_dir.resolve())
+        assert result.path_obj.resolve().is_relative_to(temp_agent_dir.resolve())
 
     def test_sanitizes_agent_content(self, temp_agent_dir):
         """Test that agent content is sanitized."""
@@ -242,7 +249,7 @@ class TestSecurityValidation:
         )
 
         result = builder.create_agent(config)
-        content = result.path.read_text()
+        content = result.path_obj.read_text()
 
         # Control characters should be removed
         assert "\x00" not in content
@@ -259,7 +266,7 @@ class TestAgentDeletion:
 
         # Create agent
         result = builder.create_agent(sample_agent_config)
-        agent_file = result.path
+        agent_file = result.path_obj
         assert agent_file.exists()
 
         # Delete agent
@@ -145,6 +145,17 @@ class TestCatalogCRUD:
         retrieved = catalog_manager.get_agent(agent_id=sample_entry.id)
         assert retrieved.description == "Updated description"
 
+    def test_update_agent_name_refreshes_lookup(self, catalog_manager, sample_entry):
+        """Test name lookups follow a renamed agent."""
+        catalog_manager.add_agent(sample_entry)
+
+        catalog_manager.update_agent(sample_entry.id, name="renamed-agent")
+
+        assert catalog_manager.get_agent(name="test-agent", scope=ScopeType.PROJECT) is None
+        renamed = catalog_manager.get_agent(name="renamed-agent", scope=ScopeType.PROJECT)
+        assert renamed is not None
+        assert renamed.id == sample_entry.id
+
     def test_update_nonexistent_agent(self, catalog_manager):
         """Test updating non-existent agent returns False."""
         fake_id = uuid4()
@@ -221,6 +232,16 @@ class TestCatalogQuery:
         names = {a.name for a in agents}
         assert names == {"agent-two", "agent-three"}
 
+    def test_list_agents_by_scope_after_scope_change(self, populated_catalog):
+        """Test per-scope listings follow an agent moved to another scope."""
+        agent = populated_catalog.get_agent(name="agent-one", scope=ScopeType.GLOBAL)
+
+        populated_catalog.update_agent(agent.id, scope=ScopeType.LOCAL)
+
+        assert populated_catalog.list_agents(scope=ScopeType.GLOBAL) == []
+        local_names = {a.name for a in populated_catalog.list_agents(scope=ScopeType.LOCAL)}
+        assert local_names == {"agent-one", "agent-four"}
+
     def test_search_agents_by_query(self, populated_catalog):
         """Test searching agents by text query."""
         # Search for "testing" in description
@@ -232,6 +253,40 @@ class TestCatalogQuery:
         assert len(results) == 1
         assert results[0].name == "agent-two"
 
+    def test_search_agents_matches_catalog_search(self, populated_catalog):
+        """Test indexed search returns the same results as a linear scan."""
+        catalog = populated_catalog._read_catalog()
+
+        for query in ["a", "ag", "AGENT", "-t", "two", "for agent-f", "Use for", "zzz"]:
+            q = query.lower()
+            expected = [
+                a.name
+                for a in catalog.agents
+                if q in a.name.lower() or q in a.description.lower()
+            ]
+            actual = [a.name for a in populated_catalog.search_agents(query=query)]
+            assert actual == expected, query
+
+    def test_search_index_refreshes_after_add(self, populated_catalog, tmp_path):
+        """Test agents added after a search are found by later searches."""
+        populated_catalog.search_agents(query="agent")
+
+        agent_file = tmp_path / "late-agent.md"
+        agent_file.write_text("# Late")
+        populated_catalog.add_agent(
+            AgentCatalogEntry(
+                name="late-agent",
+                description="Added after indexing. Use when testing.",
+                scope=ScopeType.GLOBAL,
+                model=ModelType.HAIKU,
+                path=agent_file,
+                metadata={},
+            )
+        )
+
+        results = populated_catalog.search_agents(query="late-agent")
+        assert [a.name for a in results] == ["late-agent"]
+
     def test_search_agents_by_scope_filter(self, populated_catalog):
         """Test searching with scope filter."""
         results = populated_catalog.search_agents(scope=ScopeType.PROJECT)
@@ -310,6 +365,35 @@ template: basic
         assert agent is not None
         assert agent.description == "Test agent from filesystem. Use when syncing."
 
+    def test_sync_adds_many_agents(self, sync_setup):
+        """Test sync picks up every agent file when parsing concurrently."""
+        manager, project_root = sync_setup
+        agents_dir = project_root / ".claude" / "agents"
+        for i in range(20):
+            (agents_dir / f"bulk-{i}.md").write_text(
+                f"---\nname: bulk-{i}\ndescription: Bulk agent. Use when testing.\n---\n"
+            )
+
+        report = manager.sync_catalog(project_root)
+
+        assert {"test-agent", *(f"bulk-{i}" for i in range(20))} <= set(report["added"])
+        for i in range(20):
+            assert manager.get_agent(name=f"bulk-{i}", scope=ScopeType.PROJECT) is not None
+
+    def test_sync_stamps_added_agents_once(self, sync_setup):
+        """Test agents added by one sync share a single creation timestamp."""
+        manager, project_root = sync_setup
+        agents_dir = project_root / ".claude" / "agents"
+        (agents_dir / "second-agent.md").write_text(
+            "---\nname: second-agent\ndescription: Second agent. Use when testing.\n---\n"
+        )
+
+        manager.sync_catalog(project_root)
+
+        first = manager.get_agent(name="test-agent", scope=ScopeType.PROJECT)
+        second = manager.get_agent(name="second-agent", scope=ScopeType.PROJECT)
+        assert first.created_at == first.updated_at == second.created_at
+
     def test_sync_removes_orphaned_entries(self, sync_setup, tmp_path):
         """Test sync removes catalog entries for deleted agents."""
         manager, project_root = sync_setup
@@ -336,6 +420,25 @@ template: basic
         agent = manager.get_agent(name="orphaned-agent", scope=ScopeType.PROJECT)
         assert agent is None
 
+    def test_resync_skips_stat_for_scanned_agents(self, sync_setup, monkeypatch):
+        """Test a repeat sync keeps scanned agents without stat'ing their paths."""
+        manager, project_root = sync_setup
+        manager.sync_catalog(project_root)
+        agent_path = project_root / ".claude" / "agents" / "test-agent.md"
+
+        probed = []
+        real_exists = Path.exists
+
+        def recording_exists(self, *args, **kwargs):
+            probed.append(self)
+            return real_exists(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "exists", recording_exists)
+        report = manager.sync_catalog(project_root)
+
+        assert report["removed"] == []
+        assert agent_path not in probed
+
     def test_sync_accurate_report(self, sync_setup, tmp_path):
         """Test sync returns accurate report."""
         manager, project_root = sync_setup
@@ -369,6 +472,104 @@ template: basic
         assert "orphaned" in report["removed"]
 
 
+class TestFrontmatterParsing:
+    """Test agent frontmatter extraction."""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        """CatalogManager with temporary catalog."""
+        return CatalogManager(tmp_path / "agents.json")
+
+    def test_parses_frontmatter_fields(self, manager, tmp_path):
+        """Test frontmatter keys are returned as a dict."""
+        agent_file = tmp_path / "agent.md"
+        agent_file.write_text(
+            "---\nname: my-agent\nmodel: claude-opus-4-20250514\n---\n# Body\n"
+        )
+
+        frontmatter = manager._parse_agent_frontmatter(agent_file)
+
+        assert frontmatter == {"name": "my-agent", "model": "claude-opus-4-20250514"}
+
+    def test_parses_frontmatter_larger_than_head(self, manager, tmp_path):
+        """Test frontmatter extending past the initial head read is still parsed."""
+        from src.tools.agent_builder.catalog import FRONTMATTER_HEAD_BYTES
+
+        long_description = "x" * (FRONTMATTER_HEAD_BYTES * 2)
+        agent_file = tmp_path / "agent.md"
+        agent_file.write_text(
+            f"---\nname: big-agent\ndescription: {long_description}\n---\n# Body\n"
+        )
+
+        frontmatter = manager._parse_agent_frontmatter(agent_file)
+
+        assert frontmatter["name"] == "big-agent"
+        assert frontmatter["description"] == long_description
+
+    def test_delimiter_straddling_chunk_boundary(self, manager, tmp_path):
+        """Test a closing delimiter split across two reads is still found."""
+        from src.tools.agent_builder.catalog import FRONTMATTER_HEAD_BYTES
+
+        prefix = "---\nname: edge-agent\ndescription: "
+        # Place the closing "\n---" so it begins two bytes before the chunk boundary
+        padding = "y" * (FRONTMATTER_HEAD_BYTES - 2 - len(prefix))
+        agent_file = tmp_path / "agent.md"
+        agent_file.write_text(f"{prefix}{padding}\n---\n# Body\n")
+
+        frontmatter = manager._parse_agent_frontmatter(agent_file)
+
+        assert frontmatter["name"] == "edge-agent"
+        assert frontmatter["description"] == padding
+
+    def test_simple_frontmatter_matches_yaml(self):
+        """Test the fast parser agrees with YAML or defers to it."""
+        import yaml
+
+        from src.tools.agent_builder.catalog import _parse_simple_frontmatter
+
+        simple = "name: my-agent\ndescription: Plans work. Use when scoping.\ntemplate: basic"
+        assert _parse_simple_frontmatter(simple) == yaml.safe_load(simple)
+
+        # Anything YAML would not read as a flat str -> str mapping is deferred
+        for text in [
+            "name: 'quoted'",
+            "version: 1.0",
+            "enabled: yes",
+            "empty:",
+            "tags:\n  - a\n  - b",
+            "description: >\n  folded",
+            "name: agent # comment",
+            "name: a: b",
+            "name:\tvalue",
+            "name: a\x0cdescription: b",
+            "name: bell\x07",
+        ]:
+            assert _parse_simple_frontmatter(text) is None, text
+
+    def test_complex_frontmatter_falls_back_to_yaml(self, manager, tmp_path):
+        """Test list values still parse through the YAML loader."""
+        agent_file = tmp_path / "agent.md"
+        agent_file.write_text("---\nname: list-agent\ntools:\n  - Read\n  - Write\n---\n")
+
+        frontmatter = manager._parse_agent_frontmatter(agent_file)
+
+        assert frontmatter == {"name": "list-agent", "tools": ["Read", "Write"]}
+
+    def test_missing_frontmatter_returns_empty(self, manager, tmp_path):
+        """Test files without frontmatter yield an empty dict."""
+        agent_file = tmp_path / "agent.md"
+        agent_file.write_text("# Just a heading\n")
+
+        assert manager._parse_agent_frontmatter(agent_file) == {}
+
+    def test_unterminated_frontmatter_returns_empty(self, manager, tmp_path):
+        """Test frontmatter without a closing delimiter yields an empty dict."""
+        agent_file = tmp_path / "agent.md"
+        agent_file.write_text("---\nname: broken\n# Body\n")
+
+        assert manager._parse_agent_frontmatter(agent_file) == {}
+
+
 class TestCatalogResilience:
     """Test error handling and atomic writes."""
 
@@ -398,6 +599,137 @@ class TestCatalogResilience:
         # Allow .bak files but not other temp files
         assert all(f.suffix == ".bak" for f in json_temp_files), "Found unexpected temp files"
 
+    def test_write_leaves_no_backup_file(self, tmp_path):
+        """Test writes rely on atomic rename without a .bak copy."""
+        catalog_path = tmp_path / "agents.json"
+        manager = CatalogManager(catalog_path)
+
+        manager._write_catalog(AgentCatalog(schema_version="1.0", agents=[]))
+
+        assert not list(tmp_path.glob("*.bak"))
+
+    def test_write_fsyncs_file_and_directory(self, tmp_path, monkeypatch):
+        """Test writes fsync the temp file and the parent directory."""
+        import os
+
+        manager = CatalogManager(tmp_path / "agents.json")
+        synced = []
+        real_fsync = os.fsync
+
+        def recording_fsync(fd):
+            synced.append(fd)
+            real_fsync(fd)
+
+        monkeypatch.setattr(os, "fsync", recording_fsync)
+        manager._write_catalog(AgentCatalog(schema_version="2.0", agents=[]))
+
+        assert len(synced) == 2
+
+    def test_anonymous_temp_write_leaves_no_files(self, tmp_path):
+        """Test the O_TMPFILE write path replaces the catalog cleanly."""
+        import src.tools.agent_builder.catalog as catalog_module
+
+        if not catalog_module.O_TMPFILE_AVAILABLE:
+            pytest.skip("O_TMPFILE is Linux-only")
+
+        manager = CatalogManager(tmp_path / "agents.json")
+        if not manager._write_anonymous_temp(b'{"schema_version": "1.0", "agents": []}'):
+            pytest.skip("Filesystem does not support O_TMPFILE")
+
+        assert [p.name for p in tmp_path.iterdir()] == ["agents.json"]
+        assert json.loads((tmp_path / "agents.json").read_text())["agents"] == []
+
+    def test_anonymous_temp_closes_fd_when_dir_open_fails(self, tmp_path, monkeypatch):
+        """Test the O_TMPFILE fd is closed if the directory cannot be opened."""
+        import os
+
+        import src.tools.agent_builder.catalog as catalog_module
+
+        if not catalog_module.O_TMPFILE_AVAILABLE:
+            pytest.skip("O_TMPFILE is Linux-only")
+
+        manager = CatalogManager(tmp_path / "agents.json")
+        real_open, real_close = os.open, os.close
+        opened, closed = [], []
+
+        def failing_open(path, flags, *args, **kwargs):
+            if flags == os.O_RDONLY:
+                raise PermissionError("denied")
+            fd = real_open(path, flags, *args, **kwargs)
+            opened.append(fd)
+            return fd
+
+        def recording_close(fd):
+            closed.append(fd)
+            real_close(fd)
+
+        monkeypatch.setattr(os, "open", failing_open)
+        monkeypatch.setattr(os, "close", recording_close)
+
+        try:
+            manager._write_anonymous_temp(b"{}")
+        except PermissionError:
+            pass
+
+        assert opened and closed == opened
+
+    def test_named_temp_fallback(self, tmp_path, monkeypatch):
+        """Test writes fall back to mkstemp when O_TMPFILE is unavailable."""
+        import src.tools.agent_builder.catalog as catalog_module
+
+        monkeypatch.setattr(catalog_module, "O_TMPFILE_AVAILABLE", False)
+        manager = CatalogManager(tmp_path / "agents.json")
+        manager._write_catalog(AgentCatalog(schema_version="1.0", agents=[]))
+
+        assert [p.name for p in tmp_path.iterdir()] == ["agents.json"]
+
+    def test_unchanged_catalog_skips_write(self, tmp_path):
+        """Test writing byte-identical catalog content leaves the file untouched."""
+        catalog_path = tmp_path / "agents.json"
+        manager = CatalogManager(catalog_path)
+        before = catalog_path.stat()
+
+        manager._write_catalog(AgentCatalog(schema_version="1.0", agents=[]))
+
+        after = catalog_path.stat()
+        assert (after.st_ino, after.st_mtime_ns) == (before.st_ino, before.st_mtime_ns)
+
+    def test_noop_sync_skips_write(self, tmp_path, monkeypatch):
+        """Test sync with nothing added or removed does not rewrite the catalog."""
+        monkeypatch.setenv("HOME", str(tmp_path / "home"))
+        project_root = tmp_path / "project"
+        (project_root / ".claude" / "agents").mkdir(parents=True)
+        manager = CatalogManager(project_root / "agents.json")
+        writes = []
+        monkeypatch.setattr(manager, "_write_catalog", writes.append)
+
+        report = manager.sync_catalog(project_root)
+
+        assert report == {"added": [], "removed": [], "errors": []}
+        assert writes == []
+
+    def test_deleted_catalog_is_recreated(self, tmp_path):
+        """Test a catalog file removed after init is recreated empty on next read."""
+        catalog_path = tmp_path / "agents.json"
+        manager = CatalogManager(catalog_path)
+        agent_file = tmp_path / "gone-agent.md"
+        agent_file.write_text("# Gone")
+        manager.add_agent(
+            AgentCatalogEntry(
+                name="gone-agent",
+                description="Deleted with the catalog. Use when testing.",
+                scope=ScopeType.PROJECT,
+                model=ModelType.SONNET,
+                path=agent_file,
+                metadata={},
+            )
+        )
+
+        catalog_path.unlink()
+
+        assert manager.list_agents() == []
+        assert json.loads(catalog_path.read_text())["agents"] == []
+
     def test_corrupted_json_recovery(self, tmp_path):
         """Test handling of corrupted JSON file."""
         catalog_path = tmp_path / "agents.json"
@@ -412,6 +744,115 @@ class TestCatalogResilience:
             manager._read_catalog()
 
 
+class TestCatalogCache:
+    """Test in-memory catalog caching."""
+
+    def test_repeated_reads_reuse_cached_catalog(self, tmp_path):
+        """Test unchanged catalog file is parsed only once."""
+        manager = CatalogManager(tmp_path / "agents.json")
+
+        first = manager._read_catalog()
+        second = manager._read_catalog()
+
+        assert first is second
+
+    def test_external_change_invalidates_cache(self, tmp_path):
+        """Test catalog is re-read after another process rewrites the file."""
+        catalog_path = tmp_path / "agents.json"
+        manager = CatalogManager(catalog_path)
+        assert manager.list_agents() == []
+
+        # Simulate another process adding an agent
+        agent_file = tmp_path / "external-agent.md"
+        agent_file.write_text("# External")
+        other = CatalogManager(catalog_path)
+        other.add_agent(
+            AgentCatalogEntry(
+                name="external-agent",
+                description="Added externally. Use when testing.",
+                scope=ScopeType.PROJECT,
+                model=ModelType.SONNET,
+                path=agent_file,
+                metadata={},
+            )
+        )
+
+        agents = manager.list_agents()
+        assert [a.name for a in agents] == ["external-agent"]
+
+
+class TestCatalogSerialization:
+    """Test catalog JSON serialization backends."""
+
+    def test_round_trip_without_orjson(self, tmp_path, monkeypatch):
+        """Test stdlib json fallback writes a catalog that reads back."""
+        import src.tools.agent_builder.catalog as catalog_module
+
+        monkeypatch.setattr(catalog_module, "ORJSON_AVAILABLE", False)
+        catalog_path = tmp_path / "agents.json"
+        manager = CatalogManager(catalog_path)
+
+        agent_file = tmp_path / "fallback-agent.md"
+        agent_file.write_text("# Fallback")
+        manager.add_agent(
+            AgentCatalogEntry(
+                name="fallback-agent",
+                description="Fallback serializer. Use when testing.",
+                scope=ScopeType.GLOBAL,
+                model=ModelType.HAIKU,
+                path=agent_file,
+                metadata={"template": "basic"},
+            )
+        )
+
+        data = json.loads(catalog_path.read_text())
+        assert data["agents"][0]["name"] == "fallback-agent"
+        assert CatalogManager(catalog_path).get_agent(name="fallback-agent") is not None
+
+
+    def test_large_catalog_read_via_mmap(self, tmp_path, monkeypatch):
+        """Test catalogs above the mmap threshold load correctly."""
+        pytest.importorskip("orjson")
+        import src.tools.agent_builder.catalog as catalog_module
+
+        monkeypatch.setattr(catalog_module, "MMAP_MIN_BYTES", 1)
+        catalog_path = tmp_path / "agents.json"
+        writer = CatalogManager(catalog_path)
+
+        agent_file = tmp_path / "mapped-agent.md"
+        agent_file.write_text("# Mapped")
+        writer.add_agent(
+            AgentCatalogEntry(
+                name="mapped-agent",
+                description="Read through mmap. Use when testing.",
+                scope=ScopeType.PROJECT,
+                model=ModelType.SONNET,
+                path=agent_file,
+                metadata={},
+            )
+        )
+
+        reader = CatalogManager(catalog_path)
+        assert [a.name for a in reader.list_agents()] == ["mapped-agent"]
+
+    def test_written_json_matches_pydantic_json_mode(self, tmp_path):
+        """Test the written catalog equals pydantic's JSON-mode dump, metadata included."""
+        catalog_path = tmp_path / "agents.json"
+        manager = CatalogManager(catalog_path)
+        entry = AgentCatalogEntry(
+            name="typed-agent",
+            description="Metadata with non-JSON types. Use when testing.",
+            scope=ScopeType.LOCAL,
+            model=ModelType.OPUS,
+            path=tmp_path / "typed-agent.md",
+            metadata={"source": Path("/src"), "tags": {"a"}, "scope": ScopeType.GLOBAL},
+        )
+        manager.add_agent(entry)
+
+        expected = AgentCatalog(agents=[entry]).model_dump(mode="json")
+        assert json.loads(catalog_path.read_text()) == expected
+
+
 class TestCatalogStats:
     """Test catalog statistics."""
 
@@ -259,6 +259,26 @@ class TestPathSecurityValidation:
         assert not is_valid
         assert "outside" in message.lower()
 
+    def test_symlink_loop_is_rejected(self, tmp_path):
+        """Test a path through a symlink loop is reported, not raised."""
+        base_dir = tmp_path / "agents"
+        base_dir.mkdir()
+        (base_dir / "a").symlink_to(base_dir / "b")
+        (base_dir / "b").symlink_to(base_dir / "a")
+
+        is_valid, message = AgentValidator.validate_path_security(base_dir / "a" / "x", base_dir)
+        assert not is_valid
+        assert message.startswith("Path validation error")
+
+    def test_null_byte_path_is_rejected(self, tmp_path):
+        """Test a path containing a NUL byte is reported, not raised."""
+        base_dir = tmp_path / "agents"
+        base_dir.mkdir()
+
+        is_valid, message = AgentValidator.validate_path_security(base_dir / "a\x00b", base_dir)
+        assert not is_valid
+        assert message.startswith("Path validation error")
+
 
 class TestFrontmatterValidation:
     """Tests for frontmatter key validation."""
@@ -300,6 +320,13 @@ class TestFrontmatterValidation:
         assert not is_valid
         assert "Invalid frontmatter keys" in message
 
+    def test_invalid_non_string_keys(self):
+        """Test non-string keys (e.g. YAML numbers) are reported, not raised."""
+        is_valid, message = AgentValidator.validate_frontmatter_keys({"ok": 1, 1.5: "x"})
+
+        assert is_valid is False
+        assert message == "Invalid frontmatter keys: 1.5"
+
 
 class TestStringSanitization:
     """Tests for string sanitization."""
@@ -392,3 +419,18 @@ class TestFilenameValidation:
             is_valid, message = AgentValidator.is_safe_filename(filename)
             assert not is_valid, f"Should fail for '{filename}'"
             assert "invalid characters" in message.lower()
+
+
+class TestValidationCache:
+    """Tests for memoized string validators."""
+
+    def test_repeated_input_hits_cache(self):
+        """Test validating the same input twice reuses the cached result."""
+        AgentValidator.validate_agent_name.cache_clear()
+
+        first = AgentValidator.validate_agent_name("cached-agent")
+        second = AgentValidator.validate_agent_name("cached-agent")
+
+        assert first == second == (True, "Valid agent name")
+        info = AgentValidator.validate_agent_name.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
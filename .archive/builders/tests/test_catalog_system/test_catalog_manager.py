@@ -0,0 +1,465 @@
+"""
+Tests for the CatalogManager facade.
+"""
+
+import json
+import os
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.tools.catalog_system.catalog_manager import CatalogManager
+from src.tools.catalog_system.exceptions import ScanError
+from src.tools.catalog_system.models import CommandCatalogEntry
+
+COMMAND_CONTENT = """---
+name: {name}
+description: {name} command for testing
+---
+# {name}
+"""
+
+
+@pytest.fixture
+def project_claude(tmp_path):
+    """Create a project .claude directory with one command."""
+    commands_dir = tmp_path / "project" / ".claude" / "commands"
+    commands_dir.mkdir(parents=True)
+    (commands_dir / "build.md").write_text(COMMAND_CONTENT.format(name="build"))
+    return commands_dir.parent
+
+
+@pytest.fixture
+def manager(tmp_path, project_claude):
+    """Create a CatalogManager scanning only the project .claude directory."""
+    manager = CatalogManager(manifests_dir=tmp_path / "manifests")
+    with patch.object(manager, "_get_scope_paths", return_value=[project_claude]):
+        yield manager
+
+
+class TestPrefetch:
+    """Test existing catalogs are handed to the kernel for readahead."""
+
+    def test_prefetches_existing_catalogs(self, tmp_path, monkeypatch):
+        """Test the constructor advises WILLNEED on each catalog that exists."""
+        manifests_dir = tmp_path / "manifests"
+        manifests_dir.mkdir()
+        (manifests_dir / "commands.json").write_text('{"entries": []}')
+        fadvise = Mock()
+        monkeypatch.setattr(os, "posix_fadvise", fadvise, raising=False)
+        monkeypatch.setattr(os, "POSIX_FADV_WILLNEED", 3, raising=False)
+
+        CatalogManager(manifests_dir=manifests_dir)
+
+        fadvise.assert_called_once()
+        assert fadvise.call_args.args[1:] == (0, 0, 3)
+
+    def test_prefetch_without_fadvise(self, tmp_path, monkeypatch):
+        """Test platforms without posix_fadvise skip the prefetch."""
+        monkeypatch.delattr(os, "posix_fadvise", raising=False)
+
+        manager = CatalogManager(manifests_dir=tmp_path / "manifests")
+
+        assert manager.list("commands", auto_sync=False) == []
+
+
+class TestIncrementalSync:
+    """Test sync skips unchanged element types."""
+
+    def test_first_sync_writes_catalog_and_index(self, manager):
+        """Test the first sync writes the catalog and its file index."""
+        manager.sync("commands")
+
+        catalog = json.loads((manager.manifests_dir / "commands.json").read_text())
+        index = json.loads((manager.manifests_dir / "commands.index.json").read_text())
+        assert [entry["name"] for entry in catalog["entries"]] == ["build"]
+        assert any(path.endswith("build.md") for path in index)
+
+    def test_unchanged_sync_skips_scan(self, manager):
+        """Test a second sync with no file changes does not rescan."""
+        manager.sync("commands")
+
+        with (
+            patch.object(manager.scanner, "scan_commands") as scan,
+            patch.object(manager.syncer, "sync") as sync,
+        ):
+            manager.sync("commands")
+
+        scan.assert_not_called()
+        sync.assert_not_called()
+
+    def test_added_file_triggers_sync(self, manager, project_claude):
+        """Test adding a file makes the next sync pick it up."""
+        manager.sync("commands")
+        (project_claude / "commands" / "deploy.md").write_text(
+            COMMAND_CONTENT.format(name="deploy")
+        )
+
+        manager.sync("commands")
+
+        names = {entry.name for entry in manager.list("commands", auto_sync=False)}
+        assert names == {"build", "deploy"}
+
+    def test_modified_file_triggers_sync(self, manager, project_claude):
+        """Test editing a file makes the next sync re-parse it."""
+        manager.sync("commands")
+        command_file = project_claude / "commands" / "build.md"
+        command_file.write_text(
+            COMMAND_CONTENT.format(name="build").replace("for testing", "edited")
+        )
+
+        manager.sync("commands")
+
+        (entry,) = manager.list("commands", auto_sync=False)
+        assert entry.description == "build command edited"
+
+    def test_dangling_symlink_does_not_hide_later_edits(self, manager, project_claude):
+        """Test an unstattable entry does not stop the rest of the directory being fingerprinted."""
+        commands_dir = project_claude / "commands"
+        (commands_dir / "broken.md").symlink_to(commands_dir / "missing.md")
+        manager.sync("commands")
+
+        index = json.loads((manager.manifests_dir / "commands.index.json").read_text())
+        assert index[str(commands_dir / "broken.md")] == [-1, -1]
+        assert str(commands_dir / "build.md") in index
+
+        (commands_dir / "build.md").write_text(
+            COMMAND_CONTENT.format(name="build").replace("for testing", "edited")
+        )
+        manager.sync("commands")
+
+        (entry,) = manager.list("commands", auto_sync=False)
+        assert entry.description == "build command edited"
+
+    def test_missing_catalog_forces_sync(self, manager):
+        """Test a deleted catalog is rebuilt even if the index matches."""
+        manager.sync("commands")
+        (manager.manifests_dir / "commands.json").unlink()
+
+        manager.sync("commands")
+
+        assert (manager.manifests_dir / "commands.json").exists()
+
+
+class TestSyncAll:
+    """Test syncing every element type at once."""
+
+    def test_sync_all_writes_every_catalog(self, manager):
+        """Test sync("all") writes a catalog and index for each type."""
+        manager.sync("all")
+
+        for etype in ("skills", "commands", "agents"):
+            assert (manager.manifests_dir / f"{etype}.json").exists()
+            assert (manager.manifests_dir / f"{etype}.index.json").exists()
+        assert [entry.name for entry in manager.list("all", auto_sync=False)] == ["build"]
+
+    def test_sync_all_validates_scope_paths_once(self, manager, project_claude):
+        """Test fingerprints and scans share one validation per scope path."""
+        with patch.object(
+            manager.scanner, "_validate_path", wraps=manager.scanner._validate_path
+        ) as validate_path:
+            manager.sync("all")
+            manager.sync("all")
+
+        validate_path.assert_called_once_with(project_claude)
+
+    def test_sync_all_propagates_errors(self, manager):
+        """Test a failing type's error is raised from sync("all")."""
+        with patch.object(manager.scanner, "scan_agents", side_effect=ScanError("boom")):
+            with pytest.raises(ScanError, match="boom"):
+                manager.sync("all")
+
+        assert (manager.manifests_dir / "commands.json").exists()
+
+
+class TestBackgroundSync:
+    """Test list() serves the catalog and refreshes it in the background."""
+
+    def test_missing_catalog_syncs_first(self, manager):
+        """Test list() syncs eagerly when there is no catalog yet."""
+        entries = manager.list("commands")
+
+        assert [entry.name for entry in entries] == ["build"]
+        assert manager._pending_sync is None
+
+    def test_stale_catalog_refreshes_in_background(self, manager, project_claude):
+        """Test list() returns the stale catalog, then the refresh catches up."""
+        manager.sync("commands")
+        (project_claude / "commands" / "deploy.md").write_text(
+            COMMAND_CONTENT.format(name="deploy")
+        )
+        stale = time.time() - manager.AUTO_SYNC_TTL - 1
+        os.utime(manager.manifests_dir / "commands.index.json", (stale, stale))
+
+        entries = manager.list("commands")
+        assert [entry.name for entry in entries] == ["build"]
+
+        manager._pending_sync.result(timeout=10)
+        names = {entry.name for entry in manager.list("commands", auto_sync=False)}
+        assert names == {"build", "deploy"}
+
+    def test_background_sync_error_is_logged(self, manager, caplog):
+        """Test a failing background refresh is logged rather than lost."""
+        manager.sync("commands")
+        stale = time.time() - manager.AUTO_SYNC_TTL - 1
+        os.utime(manager.manifests_dir / "commands.index.json", (stale, stale))
+
+        with (
+            patch.object(manager, "sync", side_effect=ScanError("boom")),
+            caplog.at_level("WARNING", logger="src.tools.catalog_system.catalog_manager"),
+        ):
+            manager.list("commands")
+            with pytest.raises(ScanError):
+                manager._pending_sync.result(timeout=10)
+            # Done-callbacks run after result() wakes up; joining the worker waits for them
+            manager._executor.shutdown(wait=True)
+
+        assert "Background catalog sync failed: boom" in caplog.text
+
+    def test_fresh_catalog_skips_refresh(self, manager, project_claude):
+        """Test list() does not refresh a catalog synced within the TTL."""
+        manager.sync("commands")
+        (project_claude / "commands" / "deploy.md").write_text(
+            COMMAND_CONTENT.format(name="deploy")
+        )
+
+        entries = manager.list("commands")
+
+        assert [entry.name for entry in entries] == ["build"]
+        assert manager._pending_sync is None
+
+    def test_eager_sync(self, manager, project_claude):
+        """Test auto_sync=True syncs before listing."""
+        manager.sync("commands")
+        (project_claude / "commands" / "deploy.md").write_text(
+            COMMAND_CONTENT.format(name="deploy")
+        )
+
+        names = {entry.name for entry in manager.list("commands", auto_sync=True)}
+
+        assert names == {"build", "deploy"}
+
+
+class TestShow:
+    """Test looking up a single element."""
+
+    def test_show_finds_entry(self, manager):
+        """Test show() returns the typed entry for a name."""
+        manager.sync("commands")
+
+        entry = manager.show("command", "build")
+
+        assert isinstance(entry, CommandCatalogEntry)
+        assert entry.description == "build command for testing"
+
+    def test_show_filters_by_scope(self, manager):
+        """Test show() ignores entries from other scopes."""
+        manager.sync("commands")
+
+        assert manager.show("command", "build", scope="project") is not None
+        assert manager.show("command", "build", scope="global") is None
+
+    def test_show_builds_only_the_match(self, manager, project_claude):
+        """Test show() does not construct models for non-matching entries."""
+        (project_claude / "commands" / "deploy.md").write_text(
+            COMMAND_CONTENT.format(name="deploy")
+        )
+        manager.sync("commands")
+
+        entry_cls = Mock(wraps=CommandCatalogEntry)
+        with patch.dict(
+            "src.tools.catalog_system.catalog_manager._ENTRY_TYPES", {"commands": entry_cls}
+        ):
+            entry = manager.show("command", "deploy")
+
+        assert entry.name == "deploy"
+        entry_cls.assert_called_once()
+
+    def test_show_skips_unhashable_names(self, manager):
+        """Test entries whose name is not a string are ignored by show()."""
+        (manager.manifests_dir / "commands.json").write_text(
+            '{"entries": [{"name": ["x"], "scope": "project", "file_path": "/x"}]}'
+        )
+
+        assert manager.show("command", "x") is None
+
+    def test_show_unknown_name(self, manager):
+        """Test show() returns None when nothing matches."""
+        manager.sync("commands")
+
+        assert manager.show("command", "missing") is None
+
+
+class TestStats:
+    """Test catalog statistics."""
+
+    def test_stats_counts_raw_entries(self, manager):
+        """Test get_stats() counts by type and scope."""
+        manager.sync("all")
+
+        stats = manager.get_stats()
+
+        assert stats["total"] == 1
+        assert stats["by_type"] == {"skills": 0, "commands": 1, "agents": 0}
+        assert stats["by_scope"] == {"global": 0, "project": 1, "local": 0}
+
+    def test_stats_skips_non_object_entries(self, manager):
+        """Test entries that are not objects are not counted."""
+        (manager.manifests_dir / "commands.json").write_text('{"entries": [1, 2]}')
+
+        stats = manager.get_stats()
+
+        assert stats["by_type"]["commands"] == 0
+        assert manager.show("command", "build") is None
+
+    def test_stats_skips_unknown_scopes(self, manager):
+        """Test entries list() would reject for their scope are not counted."""
+        (manager.manifests_dir / "commands.json").write_text(
+            '{"entries": [{"name": "build", "scope": "bogus", "file_path": "/x"}]}'
+        )
+
+        stats = manager.get_stats()
+
+        assert manager.list("commands", auto_sync=False) == []
+        assert stats["total"] == 0
+        assert stats["by_scope"] == {"global": 0, "project": 0, "local": 0}
+
+    def test_stats_ignores_corrupted_catalog(self, manager):
+        """Test an unparseable catalog counts as empty."""
+        (manager.manifests_dir / "skills.json").write_text("{not json")
+
+        stats = manager.get_stats()
+
+        assert stats["by_type"]["skills"] == 0
+
+
+class TestCatalogCache:
+    """Test parsed catalogs are reused while the file is unchanged."""
+
+    def test_repeated_loads_parse_once(self, manager):
+        """Test a second load reuses the parsed entries."""
+        manager.sync("commands")
+        first = manager.list("commands", auto_sync=False)
+
+        with patch.object(manager, "_iter_catalog_raw") as iter_raw:
+            second = manager.list("commands", auto_sync=False)
+
+        iter_raw.assert_not_called()
+        assert second == first
+        assert second is not first
+
+    def test_sync_invalidates_cache(self, manager, project_claude):
+        """Test a sync that rewrites the catalog is picked up by the next load."""
+        manager.sync("commands")
+        manager.list("commands", auto_sync=False)
+        (project_claude / "commands" / "deploy.md").write_text(
+            COMMAND_CONTENT.format(name="deploy")
+        )
+
+        manager.sync("commands")
+
+        names = {entry.name for entry in manager.list("commands", auto_sync=False)}
+        assert names == {"build", "deploy"}
+
+    def test_external_write_invalidates_cache(self, manager):
+        """Test a catalog rewritten outside this manager is reloaded."""
+        manager.sync("commands")
+        manager.list("commands", auto_sync=False)
+        (manager.manifests_dir / "commands.json").write_text('{"entries": []}')
+
+        assert manager.list("commands", auto_sync=False) == []
+        assert manager.show("command", "build") is None
+
+    def test_show_reuses_name_index(self, manager):
+        """Test repeated show() calls parse the catalog once."""
+        manager.sync("commands")
+        manager.show("command", "build")
+
+        with patch.object(manager, "_iter_catalog_raw") as iter_raw:
+            entry = manager.show("command", "build")
+
+        iter_raw.assert_not_called()
+        assert entry.name == "build"
+
+    def test_invalid_entry_skips_catalog(self, manager):
+        """Test a catalog with an invalid entry loads as empty."""
+        (manager.manifests_dir / "commands.json").write_text(
+            '{"entries": [{"name": "", "scope": "project", "file_path": "/x"}]}'
+        )
+
+        assert manager.list("commands", auto_sync=False) == []
+
+    def test_invalid_entry_is_logged(self, manager, caplog):
+        """Test the validation error of a skipped catalog is logged at debug level."""
+        (manager.manifests_dir / "commands.json").write_text('{"entries": [{"name": ""}]}')
+
+        with caplog.at_level("DEBUG", logger="src.tools.catalog_system.catalog_manager"):
+            manager.list("commands", auto_sync=False)
+
+        assert "Skipping invalid commands catalog" in caplog.text
+
+    def test_malformed_entries_load_as_empty(self, manager):
+        """Test a catalog whose entries are not a list loads as empty."""
+        (manager.manifests_dir / "commands.json").write_text('{"entries": 5}')
+
+        assert manager.list("commands", auto_sync=False) == []
+        assert manager.get_stats()["by_type"]["commands"] == 0
+
+
+class TestScopeFilter:
+    """Test scope filtering runs before search and is cached."""
+
+    @pytest.fixture
+    def two_scopes(self, manager):
+        """Write a commands catalog with a global and a project entry."""
+        entries = [
+            {"name": name, "scope": scope, "description": f"{name} build", "file_path": "/x"}
+            for name, scope in [("global-build", "global"), ("project-build", "project")]
+        ]
+        (manager.manifests_dir / "commands.json").write_text(json.dumps({"entries": entries}))
+        return manager
+
+    def test_search_filters_by_scope(self, two_scopes):
+        """Test search() only returns entries from the requested scope."""
+        results = two_scopes.search("build", element_type="commands", scope="global")
+
+        assert [entry.name for entry in results] == ["global-build"]
+
+    def test_scope_partition_reused(self, two_scopes):
+        """Test repeated scoped loads partition the catalog once."""
+        with patch.object(
+            two_scopes.searcher, "filter_by_scope", wraps=two_scopes.searcher.filter_by_scope
+        ) as filter_by_scope:
+            two_scopes.search("build", element_type="commands", scope="project")
+            listed = two_scopes.list("commands", scope="project", auto_sync=False)
+
+        assert [entry.name for entry in listed] == ["project-build"]
+        filter_by_scope.assert_called_once()
+
+
+class TestStreaming:
+    """Test large catalogs are streamed with ijson."""
+
+    @pytest.fixture(autouse=True)
+    def stream_everything(self, monkeypatch):
+        """Stream every catalog regardless of size."""
+        pytest.importorskip("ijson")
+        monkeypatch.setattr("src.tools.catalog_system.catalog_manager.STREAM_MIN_BYTES", 0)
+
+    def test_streamed_catalog_loads(self, manager):
+        """Test a streamed catalog yields the same entries and stats."""
+        manager.sync("commands")
+
+        (entry,) = manager.list("commands", auto_sync=False)
+
+        assert entry.name == "build"
+        assert manager.get_stats()["by_type"]["commands"] == 1
+
+    def test_damaged_stream_stops_at_last_intact_entry(self, manager):
+        """Test a truncated streamed catalog yields the entries before the damage."""
+        (manager.manifests_dir / "commands.json").write_text(
+            '{"entries": [{"name": "build", "scope": "project"}, {"name": "dep'
+        )
+
+        assert manager.get_stats()["by_type"]["commands"] == 1
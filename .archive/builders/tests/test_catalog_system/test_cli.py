@@ -0,0 +1,70 @@
+"""
+Tests for the catalog system CLI.
+"""
+
+import pytest
+from click.testing import CliRunner
+from tabulate import tabulate
+
+from src.tools.catalog_system.cli import cli, format_table
+
+
+@pytest.fixture
+def runner(tmp_path, monkeypatch):
+    """Create a CliRunner working in an empty directory."""
+    monkeypatch.chdir(tmp_path)
+    return CliRunner()
+
+
+class TestManagerReuse:
+    """Test commands share one CatalogManager through the click context."""
+
+    def test_commands_share_manager(self, runner):
+        """Test commands run with the same obj reuse one CatalogManager."""
+        obj: dict = {}
+
+        result = runner.invoke(cli, ["list", "commands", "--no-sync"], obj=obj)
+        assert result.exit_code == 0
+        managers = dict(obj["catalogs"])
+        assert len(managers) == 1
+
+        result = runner.invoke(cli, ["stats"], obj=obj)
+        assert result.exit_code == 0
+        assert obj["catalogs"] == managers
+
+
+class TestListCommand:
+    """Test 'list' command options."""
+
+    def test_list_rejects_conflicting_sync_flags(self, runner):
+        """Test --force-sync and --no-sync cannot be combined."""
+        result = runner.invoke(cli, ["list", "commands", "--force-sync", "--no-sync"])
+
+        assert result.exit_code != 0
+        assert "mutually exclusive" in result.output
+
+
+class TestFormatTable:
+    """Test format_table matches tabulate's "simple" format."""
+
+    @pytest.mark.parametrize(
+        "rows",
+        [
+            [("python-tester", "global", "Runs pytest"), ("lint", "project", "")],
+            [("  padded  ", "local", "trailing  ")],
+            [("123", "global", "numeric name"), ("skill", "project", "1,000")],
+            [("1", "global", "only numeric names"), ("2", "local", "x")],
+            [("caf\u00e9", "global", "wide \u6f22\u5b57")],
+            [("multi", "global", "line\nbreak")],
+            [],
+            [("lint", "0", "x"), ("build", "True", "y")],
+            [("lint", "global", "False"), ("build", "project", "inf")],
+        ],
+    )
+    def test_matches_tabulate(self, rows):
+        """Test the output is identical to tabulate's."""
+        headers = ["Name", "Scope", "Description"]
+
+        assert format_table(iter(rows), headers) == tabulate(
+            rows, headers=headers, tablefmt="simple"
+        )
@@ -26,7 +26,8 @@ class TestCatalogEntry:
         assert entry.name == "test-skill"
         assert entry.scope == "global"
         assert entry.description == "A test skill"
-        assert entry.file_path == Path("/path/to/skill.md")
+        assert entry.file_path == "/path/to/skill.md"
+        assert entry.file_path_obj == Path("/path/to/skill.md")
         assert isinstance(entry.id, UUID)
         assert isinstance(entry.created_at, datetime)
         assert isinstance(entry.updated_at, datetime)
@@ -39,7 +40,7 @@ class TestCatalogEntry:
         assert entry.name == "minimal"
         assert entry.scope == "project"
         assert entry.description == ""  # Default empty string
-        assert entry.file_path == Path("/path/to/file.md")
+        assert entry.file_path == "/path/to/file.md"
 
     def test_catalog_entry_name_validation_min_length(self):
         """Test name field has minimum length validation."""
@@ -120,6 +121,18 @@ class TestCatalogEntry:
         assert isinstance(entry2.id, UUID)
         assert entry1.id != entry2.id  # Different UUIDs
 
+    def test_catalog_entry_is_frozen(self):
+        """Test entries reject assignment and update through model_copy."""
+        from src.tools.catalog_system.models import CatalogEntry
+
+        entry = CatalogEntry(name="test", scope="global", file_path=Path("/path/to/file.md"))
+
+        with pytest.raises(ValidationError):
+            entry.name = "renamed"
+
+        assert entry.model_copy(update={"name": "renamed"}).name == "renamed"
+        assert entry.name == "test"
+
 
 class TestSkillCatalogEntry:
     """Test SkillCatalogEntry model."""
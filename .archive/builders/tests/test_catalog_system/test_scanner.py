@@ -143,7 +143,7 @@ class TestScanSkills:
         assert entry.description == "A test skill for scanning"
         assert entry.template == "basic"
         assert entry.allowed_tools == ["Read", "Write"]
-        assert entry.file_path == sample_skill_file
+        assert entry.file_path_obj == sample_skill_file
 
     def test_scan_skills_multiple_skills(self, scanner, temp_skills_dir):
         """Test scanning directory with multiple skills."""
@@ -366,6 +366,54 @@ description: Minimal command
         assert result[0].requires_tools == []
         assert result[0].tags == []
 
+    def test_scan_commands_long_frontmatter(self, temp_commands_dir):
+        """Test frontmatter longer than one read chunk is parsed in full."""
+        from src.tools.catalog_system.scanner import FRONTMATTER_HEAD_BYTES
+
+        scanner = Scanner(validate=False)
+
+        tags = [f"tag-{i}" for i in range(FRONTMATTER_HEAD_BYTES // 8)]
+        command_file = temp_commands_dir / "long-command.md"
+        command_file.write_text(
+            f"---\ntags: [{', '.join(tags)}]\nname: long-command\n---\n# Body\n"
+        )
+
+        result = scanner.scan_commands([temp_commands_dir.parent])
+        assert len(result) == 1
+        assert result[0].name == "long-command"
+        assert result[0].tags == tags
+
+    def test_scan_commands_unterminated_frontmatter(self, temp_commands_dir):
+        """Test frontmatter without a closing delimiter is ignored."""
+        scanner = Scanner(validate=False)
+        command_file = temp_commands_dir / "unterminated.md"
+        command_file.write_text("---\nname: other-name\n# Body\n")
+
+        result = scanner.scan_commands([temp_commands_dir.parent])
+        assert len(result) == 1
+        assert result[0].name == "unterminated"
+
+
+    def test_scan_commands_dashes_inside_frontmatter(self, temp_commands_dir):
+        """Test --- inside a value does not end the frontmatter."""
+        scanner = Scanner(validate=False)
+        command_file = temp_commands_dir / "dashes.md"
+        command_file.write_text("---\nname: dashes\ndescription: before---after\n---\n# Body\n")
+
+        result = scanner.scan_commands([temp_commands_dir.parent])
+        assert len(result) == 1
+        assert result[0].description == "before---after"
+
+    def test_scan_commands_empty_frontmatter(self, temp_commands_dir):
+        """Test an empty frontmatter block falls back to the filename."""
+        scanner = Scanner(validate=False)
+        command_file = temp_commands_dir / "empty.md"
+        command_file.write_text("---\n---\n# Body\n")
+
+        result = scanner.scan_commands([temp_commands_dir.parent])
+        assert len(result) == 1
+        assert result[0].name == "empty"
+
 
 class TestScanAgents:
     """Test agent scanning functionality."""
@@ -435,6 +483,59 @@ model: opus
         assert result[0].requires_skills == []
 
 
+class TestScanAll:
+    """Test scanning every element type at once."""
+
+    def test_scan_all_matches_individual_scans(
+        self, scanner, sample_skill_file, sample_command_file, sample_agent_file
+    ):
+        """Test scan_all returns what the per-type scans return."""
+        claude_dir = sample_command_file.parent.parent
+
+        result = scanner.scan_all([claude_dir])
+
+        assert set(result) == {"skills", "commands", "agents"}
+        assert [e.name for e in result["skills"]] == [
+            e.name for e in scanner.scan_skills([claude_dir])
+        ]
+        assert [e.name for e in result["commands"]] == ["test-command"]
+        assert [e.name for e in result["agents"]] == ["test-agent"]
+
+    def test_scan_all_keeps_scope_path_order(self, tmp_path):
+        """Test entries follow the order of the scope paths."""
+        scanner = Scanner(validate=False)
+        scope_paths = []
+        for name in ("first", "second", "third"):
+            commands_dir = tmp_path / name / ".claude" / "commands"
+            commands_dir.mkdir(parents=True)
+            (commands_dir / f"{name}.md").write_text(f"---\nname: {name}\n---\n")
+            scope_paths.append(commands_dir.parent)
+
+        result = scanner.scan_all(scope_paths)
+
+        assert [e.name for e in result["commands"]] == ["first", "second", "third"]
+        assert result["skills"] == [] and result["agents"] == []
+
+    def test_scan_all_validates_each_scope_path_once(self, scanner, tmp_path, monkeypatch):
+        """Test the three scans share one validation per scope path."""
+        calls = []
+        validate_path = scanner._validate_path
+        monkeypatch.setattr(
+            scanner, "_validate_path", lambda path: calls.append(path) or validate_path(path)
+        )
+        scope_paths = [tmp_path / "one" / ".claude", tmp_path / "two" / ".claude"]
+
+        scanner.scan_all(scope_paths)
+        scanner.scan_commands(scope_paths)
+
+        assert sorted(calls) == sorted(scope_paths)
+
+    def test_scan_all_propagates_errors(self, scanner, tmp_path):
+        """Test an invalid scope path raises from scan_all."""
+        with pytest.raises(ScanError):
+            scanner.scan_all([tmp_path / ".." / "escape"])
+
+
 class TestSecurityValidation:
     """Test security features (path traversal prevention)."""
 
@@ -471,7 +572,7 @@ template: basic
 
         assert len(result) == 1
         # Paths should be resolved/normalized
-        assert result[0].file_path.is_absolute()
+        assert result[0].file_path_obj.is_absolute()
 
 
 class TestErrorHandling:
@@ -584,6 +685,34 @@ template: basic
         # Should detect project scope
         assert result[0].scope == "project"
 
+    def test_scan_detects_symlinked_global_scope(self, scanner, tmp_path, monkeypatch):
+        """Test a ~/.claude symlinked elsewhere is still detected as global."""
+        from src.tools.catalog_system.scanner import _global_claude_dir
+
+        dotfiles = tmp_path / "dotfiles" / "claude"
+        skill_dir = dotfiles / "skills" / "linked-skill"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text(
+            """---
+name: linked-skill
+description: Linked skill
+template: basic
+---
+"""
+        )
+        home = tmp_path / "home"
+        home.mkdir()
+        (home / ".claude").symlink_to(dotfiles)
+        monkeypatch.setenv("HOME", str(home))
+        _global_claude_dir.cache_clear()
+
+        try:
+            result = scanner.scan_skills([home / ".claude"])
+        finally:
+            _global_claude_dir.cache_clear()
+
+        assert [s.scope for s in result] == ["global"]
+
     def test_scan_detects_local_scope(self, scanner, tmp_path):
         """Test scanner detects local scope when appropriate."""
         # Local scope is tricky - might need specific markers
@@ -7,6 +7,7 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+from src.tools.catalog_system import syncer as syncer_module
 from src.tools.catalog_system.syncer import Syncer
 from src.tools.catalog_system.models import (
     SkillCatalogEntry,
@@ -143,6 +144,36 @@ class TestSync:
         data = json.loads(temp_catalog.read_text())
         assert "schema_version" in data
 
+    def test_sync_writes_json_mode_entries(self, syncer, temp_catalog):
+        """Test written entries match pydantic's JSON-mode dump."""
+        entry = AgentCatalogEntry(
+            name="agent1",
+            scope="project",
+            description="Agent 1",
+            file_path=Path("/test/agent1.md"),
+            model="sonnet",
+            requires_skills=["skill1"],
+        )
+
+        syncer.sync(temp_catalog, [entry])
+
+        data = json.loads(temp_catalog.read_text())
+        assert data["entries"] == [entry.model_dump(mode="json")]
+
+    def test_sync_reads_mapped_catalog(self, syncer, temp_catalog, monkeypatch):
+        """Test a catalog above the mmap threshold is read back intact."""
+        monkeypatch.setattr(syncer_module, "MMAP_MIN_BYTES", 1)
+        entry = SkillCatalogEntry(
+            name="skill1",
+            scope="global",
+            description="Skill 1",
+            file_path=Path("/test/skill1"),
+            template="basic",
+        )
+        syncer.sync(temp_catalog, [entry])
+
+        assert syncer._read_catalog(temp_catalog) == [entry]
+
 
 class TestErrorHandling:
     """Test error handling."""
@@ -272,6 +272,27 @@ class TestPrecedence:
         assert ScopeType.PROJECT in scope_types
         assert ScopeType.GLOBAL in scope_types
 
+    def test_resolve_all_scopes_walks_project_root_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should locate the project root a single time for all scopes."""
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+        (project_dir / ".claude").mkdir()
+
+        manager = ScopeManager(project_dir)
+        calls = []
+        original = manager.find_project_root
+
+        def counting_find_project_root() -> Path | None:
+            calls.append(1)
+            return original()
+
+        monkeypatch.setattr(manager, "find_project_root", counting_find_project_root)
+        manager.resolve_all_scopes()
+
+        assert len(calls) == 1
+
 
 class TestCLIFlags:
     """Tests for CLI flag handling."""
@@ -463,6 +484,17 @@ class TestScopeConfig:
         assert config_exists.exists is True
         assert config_missing.exists is False
 
+    def test_scope_config_is_immutable(self, tmp_path: Path) -> None:
+        """ScopeConfig should reject mutation and be usable as a dict key."""
+        config = ScopeConfig(
+            path=tmp_path / ".claude", type=ScopeType.GLOBAL, precedence=3, exists=False
+        )
+
+        with pytest.raises(AttributeError):
+            config.exists = True  # type: ignore[misc]
+
+        assert {config: "cached"}[config] == "cached"
+
 
 class TestScopeType:
     """Tests for ScopeType enum."""
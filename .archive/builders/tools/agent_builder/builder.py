@@ -19,7 +19,6 @@ Performance Target:
 """
 
 import os
-import yaml
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -120,8 +119,11 @@ class AgentBuilder:
                 f"Agent '{config.name}' already exists in {config.scope.value} scope"
             )
 
+        # Stringify once; reused for every filesystem call below
+        agent_file_str = str(agent_file)
+
         # Check if file exists on disk
-        if agent_file.exists():
+        if os.path.exists(agent_file_str):
             raise AgentExistsError(
                 f"Agent file '{agent_file}' already exists. "
                 "Delete it first or use a different name."
@@ -131,10 +133,12 @@ class AgentBuilder:
         content = self._generate_agent_content(config)
 
         # Write file
-        agent_file.write_text(content, encoding="utf-8")
-        os.chmod(agent_file, self.FILE_PERMISSIONS)
+        with open(agent_file_str, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.chmod(agent_file_str, self.FILE_PERMISSIONS)
 
-        # Create catalog entry
+        # Create catalog entry (single timestamp so created_at == updated_at)
+        now = datetime.now()
         entry = AgentCatalogEntry(
             id=uuid4(),
             name=config.name,
@@ -142,8 +146,8 @@ class AgentBuilder:
             scope=config.scope,
             model=config.model,
             path=agent_file.resolve(),
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
             metadata={
                 "template": config.template,
                 **config.frontmatter,
@@ -165,6 +169,9 @@ class AgentBuilder:
         Returns:
             Complete markdown content with frontmatter
         """
+        # Deferred import: only agent creation needs YAML, not listing or lookup
+        import yaml
+
         # Build frontmatter
         frontmatter = {
             "name": config.name,
@@ -240,8 +247,9 @@ Use this agent when you need specialized assistance for this task.
             return False
 
         # Delete file if it exists
-        if agent.path.exists():
-            agent.path.unlink()
+        agent_file = agent.path_obj
+        if agent_file.exists():
+            agent_file.unlink()
 
         # Remove from catalog
         return self.catalog.remove_agent(agent_id)
@@ -12,53 +12,94 @@ Usage:
     python -m src.tools.agent_builder.main stats                     # Catalog statistics
     python -m src.tools.agent_builder.main sync                      # Sync catalog with filesystem
     python -m src.tools.agent_builder.main validate agent-file.md    # Validate agent file
+    python -m src.tools.agent_builder.main validate --glob ".claude/agents/**/*.md"
 """
 
+import glob
+import importlib
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 import click
-from pydantic import ValidationError as PydanticValidationError
+import yaml
 
-from src.tools.agent_builder.builder import AgentBuilder
-from src.tools.agent_builder.catalog import CatalogManager
+from src.tools.agent_builder.catalog import (
+    FRONTMATTER_HEAD_BYTES,
+    CatalogManager,
+    parse_frontmatter_text,
+)
 from src.tools.agent_builder.exceptions import (
     CatalogError,
     AgentBuilderError,
     AgentExistsError,
+    AgentValidationError,
     AgentNotFoundError,
     TemplateError,
 )
 from src.tools.agent_builder.models import AgentConfig, ScopeType, ModelType
-from src.tools.agent_builder.templates import TemplateManager
-from src.tools.agent_builder.wizard import AgentWizard
 from src.core.scope_manager import ScopeManager
 
+# Imported by the commands that use them rather than at startup: the wizard
+# pulls in questionary/prompt_toolkit, which list/search/stats/delete/sync
+# never need. Module-level access still works through __getattr__.
+_LAZY_IMPORTS = {
+    "AgentBuilder": "src.tools.agent_builder.builder",
+    "AgentWizard": "src.tools.agent_builder.wizard",
+    "TemplateManager": "src.tools.agent_builder.templates",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve names this module used to import eagerly (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
+
+
+# Display badges, built once at import rather than on every formatted row
+_SCOPE_BADGES = {
+    ScopeType.GLOBAL: "🌐 global",
+    ScopeType.PROJECT: "📦 project",
+    ScopeType.LOCAL: "💻 local",
+}
+
+_MODEL_BADGES = {
+    ModelType.HAIKU: "⚡ Haiku",
+    ModelType.SONNET: "🎯 Sonnet",
+    ModelType.OPUS: "🧠 Opus",
+}
+
+
+# CLI choice -> enum, so commands look values up instead of calling the Enum
+_SCOPE_MAP = {
+    "global": ScopeType.GLOBAL,
+    "project": ScopeType.PROJECT,
+    "local": ScopeType.LOCAL,
+}
+
+_MODEL_MAP = {
+    "haiku": ModelType.HAIKU,
+    "sonnet": ModelType.SONNET,
+    "opus": ModelType.OPUS,
+}
+
 
 def format_scope_badge(scope: ScopeType) -> str:
     """Format scope as colored badge."""
-    badges = {
-        ScopeType.GLOBAL: "🌐 global",
-        ScopeType.PROJECT: "📦 project",
-        ScopeType.LOCAL: "💻 local",
-    }
-    return badges.get(scope, str(scope))
+    return _SCOPE_BADGES.get(scope, str(scope))
 
 
 def format_model_badge(model: ModelType) -> str:
     """Format model as colored badge."""
-    badges = {
-        ModelType.HAIKU: "⚡ Haiku",
-        ModelType.SONNET: "🎯 Sonnet",
-        ModelType.OPUS: "🧠 Opus",
-    }
-    return badges.get(model, str(model))
+    return _MODEL_BADGES.get(model, str(model))
 
 
 def format_agent_entry(entry, show_path: bool = False) -> str:
     """Format agent entry for display."""
-    scope_badge = format_scope_badge(entry.scope)
-    model_badge = format_model_badge(entry.model)
+    # Inline badge lookups; this runs once per listed agent
+    scope_badge = _SCOPE_BADGES.get(entry.scope, str(entry.scope))
+    model_badge = _MODEL_BADGES.get(entry.model, str(entry.model))
 
     output = f"""
   Name:        {entry.name}
@@ -75,17 +116,63 @@ def format_agent_entry(entry, show_path: bool = False) -> str:
     return output
 
 
+def echo_agent_list(header: str, agents) -> None:
+    """
+    Print a header and one separated entry per agent in a single write.
+
+    Building the whole listing first and echoing it once avoids a flush per
+    line when the catalog is large.
+
+    Args:
+        header: Heading printed above the first separator
+        agents: Agent entries to display
+    """
+    separator = "─" * 60
+    parts = [header, separator]
+    for agent in agents:
+        parts.append(format_agent_entry(agent))
+        parts.append(separator)
+    click.echo("\n".join(parts))
+
+
+def get_catalog(ctx: click.Context, project_path: Path) -> CatalogManager:
+    """
+    Get the CatalogManager for a project, shared by commands in this process.
+
+    CatalogManager keeps the parsed catalog until agents.json changes on disk,
+    so reusing one instance per catalog file lets later commands (or repeated
+    invocations of ``cli`` with the same ``obj``) skip re-reading it.
+
+    Args:
+        ctx: Click context; managers are kept in ``ctx.obj["catalogs"]``
+        project_path: Project root containing agents.json
+
+    Returns:
+        CatalogManager for ``project_path / "agents.json"``
+    """
+    managers = ctx.ensure_object(dict).setdefault("catalogs", {})
+    catalog_path = (project_path / "agents.json").resolve()
+
+    manager = managers.get(catalog_path)
+    if manager is None:
+        manager = managers[catalog_path] = CatalogManager(catalog_path)
+    return manager
+
+
 @click.group()
 @click.version_option(version="1.0.0")
-def cli() -> None:
+@click.pass_context
+def cli(ctx: click.Context) -> None:
     """Agent Builder - Create Claude Code agents."""
-    pass
+    ctx.ensure_object(dict)
 
 
 @cli.command()
 @click.option("--project-root", type=click.Path(exists=True), help="Project root directory")
 def create(project_root: Optional[str]) -> None:
     """Create a new agent using interactive wizard."""
+    from src.tools.agent_builder.wizard import AgentWizard
+
     project_path = Path(project_root) if project_root else Path.cwd()
 
     try:
@@ -140,7 +227,9 @@ def create(project_root: Optional[str]) -> None:
 )
 @click.option("--dry-run", is_flag=True, help="Preview without creating files")
 @click.option("--project-root", type=click.Path(exists=True), help="Project root directory")
+@click.pass_context
 def generate(
+    ctx: click.Context,
     name: str,
     description: str,
     scope: str,
@@ -150,23 +239,19 @@ def generate(
     project_root: Optional[str],
 ) -> None:
     """Create a new agent non-interactively using CLI options."""
+    from pydantic import ValidationError as PydanticValidationError
+
+    from src.tools.agent_builder.builder import AgentBuilder
+
     project_path = Path(project_root) if project_root else Path.cwd()
 
     try:
-        # Map model string to ModelType
-        model_map = {
-            "haiku": ModelType.HAIKU,
-            "sonnet": ModelType.SONNET,
-            "opus": ModelType.OPUS,
-        }
-        model_type = model_map[model]
-
         # Create config
         config = AgentConfig(
             name=name,
             description=description,
-            scope=ScopeType(scope),
-            model=model_type,
+            scope=_SCOPE_MAP[scope],
+            model=_MODEL_MAP[model],
             template=template,
         )
 
@@ -195,7 +280,7 @@ def generate(
         entry = builder.create_agent(config)
 
         # Add to catalog
-        catalog_mgr = CatalogManager(project_path / "agents.json")
+        catalog_mgr = get_catalog(ctx, project_path)
         catalog_mgr.add_agent(entry)
 
         # Success message
@@ -248,7 +333,9 @@ def generate(
     help="Filter by Claude model",
 )
 @click.option("--project-root", type=click.Path(exists=True), help="Project root directory")
+@click.pass_context
 def list_agents(
+    ctx: click.Context,
     scope: str,
     search: Optional[str],
     template: Optional[str],
@@ -259,18 +346,11 @@ def list_agents(
     project_path = Path(project_root) if project_root else Path.cwd()
 
     try:
-        catalog_mgr = CatalogManager(project_path / "agents.json")
+        catalog_mgr = get_catalog(ctx, project_path)
 
         # Prepare filters
-        scope_filter = None if scope == "all" else ScopeType(scope)
-        model_filter = None
-        if model:
-            model_map = {
-                "haiku": ModelType.HAIKU,
-                "sonnet": ModelType.SONNET,
-                "opus": ModelType.OPUS,
-            }
-            model_filter = model_map[model]
+        scope_filter = None if scope == "all" else _SCOPE_MAP[scope]
+        model_filter = _MODEL_MAP[model] if model else None
 
         # Search agents
         agents = catalog_mgr.search_agents(
@@ -284,14 +364,8 @@ def list_agents(
             click.echo("📋 No agents found matching criteria")
             return
 
-        # Display header
-        click.echo(f"\n📋 Agents ({len(agents)} total):\n")
-        click.echo("─" * 60)
-
-        # Display each agent
-        for agent in agents:
-            click.echo(format_agent_entry(agent))
-            click.echo("─" * 60)
+        # Display header and each agent
+        echo_agent_list(f"\n📋 Agents ({len(agents)} total):\n", agents)
 
         # Display filter info
         filters = []
@@ -324,15 +398,22 @@ def list_agents(
 )
 @click.option("--yes", is_flag=True, help="Skip confirmation prompt")
 @click.option("--project-root", type=click.Path(exists=True), help="Project root directory")
-def delete(agent_name: str, scope: Optional[str], yes: bool, project_root: Optional[str]) -> None:
+@click.pass_context
+def delete(
+    ctx: click.Context,
+    agent_name: str,
+    scope: Optional[str],
+    yes: bool,
+    project_root: Optional[str],
+) -> None:
     """Delete an agent by name."""
     project_path = Path(project_root) if project_root else Path.cwd()
 
     try:
-        catalog_mgr = CatalogManager(project_path / "agents.json")
+        catalog_mgr = get_catalog(ctx, project_path)
 
         # Find agent in catalog
-        scope_filter = ScopeType(scope) if scope else None
+        scope_filter = _SCOPE_MAP[scope] if scope else None
         agent = catalog_mgr.get_agent(name=agent_name, scope=scope_filter)
 
         if not agent:
@@ -351,8 +432,9 @@ def delete(agent_name: str, scope: Optional[str], yes: bool, project_root: Optio
                 return
 
         # Delete agent file
-        if agent.path.exists():
-            agent.path.unlink()
+        agent_file = agent.path_obj
+        if agent_file.exists():
+            agent_file.unlink()
 
         # Remove from catalog
         success = catalog_mgr.remove_agent(agent.id)
@@ -377,12 +459,13 @@ def delete(agent_name: str, scope: Optional[str], yes: bool, project_root: Optio
 @cli.command()
 @click.argument("query")
 @click.option("--project-root", type=click.Path(exists=True), help="Project root directory")
-def search(query: str, project_root: Optional[str]) -> None:
+@click.pass_context
+def search(ctx: click.Context, query: str, project_root: Optional[str]) -> None:
     """Search agents by query string."""
     project_path = Path(project_root) if project_root else Path.cwd()
 
     try:
-        catalog_mgr = CatalogManager(project_path / "agents.json")
+        catalog_mgr = get_catalog(ctx, project_path)
 
         # Search agents
         agents = catalog_mgr.search_agents(query=query)
@@ -392,12 +475,7 @@ def search(query: str, project_root: Optional[str]) -> None:
             return
 
         # Display results
-        click.echo(f"\n🔍 Search results for '{query}' ({len(agents)} found):\n")
-        click.echo("─" * 60)
-
-        for agent in agents:
-            click.echo(format_agent_entry(agent))
-            click.echo("─" * 60)
+        echo_agent_list(f"\n🔍 Search results for '{query}' ({len(agents)} found):\n", agents)
 
     except CatalogError as e:
         click.echo(f"❌ Catalog error: {e}", err=True)
@@ -409,12 +487,13 @@ def search(query: str, project_root: Optional[str]) -> None:
 
 @cli.command()
 @click.option("--project-root", type=click.Path(exists=True), help="Project root directory")
-def stats(project_root: Optional[str]) -> None:
+@click.pass_context
+def stats(ctx: click.Context, project_root: Optional[str]) -> None:
     """Display catalog statistics."""
     project_path = Path(project_root) if project_root else Path.cwd()
 
     try:
-        catalog_mgr = CatalogManager(project_path / "agents.json")
+        catalog_mgr = get_catalog(ctx, project_path)
 
         # Get statistics
         stats_data = catalog_mgr.get_catalog_stats()
@@ -456,12 +535,13 @@ def stats(project_root: Optional[str]) -> None:
 
 @cli.command()
 @click.option("--project-root", type=click.Path(exists=True), help="Project root directory")
-def sync(project_root: Optional[str]) -> None:
+@click.pass_context
+def sync(ctx: click.Context, project_root: Optional[str]) -> None:
     """Sync catalog with filesystem (add missing, remove orphaned)."""
     project_path = Path(project_root) if project_root else Path.cwd()
 
     try:
-        catalog_mgr = CatalogManager(project_path / "agents.json")
+        catalog_mgr = get_catalog(ctx, project_path)
 
         click.echo("\n🔄 Syncing catalog with filesystem...")
 
@@ -500,78 +580,120 @@ def sync(project_root: Optional[str]) -> None:
         raise click.Abort()
 
 
-@cli.command()
-@click.argument("agent_path", type=click.Path(exists=True))
-def validate(agent_path: str) -> None:
-    """Validate an agent markdown file."""
-    path = Path(agent_path)
-
-    try:
-        # Check file extension
-        if not path.suffix == ".md":
-            click.echo("❌ Agent file must have .md extension", err=True)
-            raise click.Abort()
-
-        # Try to parse frontmatter
-        import yaml
-
-        content = path.read_text()
-
-        if not content.startswith("---"):
-            click.echo("❌ Agent file must start with YAML frontmatter (---)", err=True)
-            raise click.Abort()
-
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            click.echo("❌ Invalid frontmatter format", err=True)
-            raise click.Abort()
+def _check_agent_file(path: Path, validator: Any) -> Dict[str, Any]:
+    """
+    Parse and validate the frontmatter of one agent file.
+
+    Args:
+        path: Agent markdown file
+        validator: AgentValidator class, imported once by the caller
+
+    Returns:
+        Parsed frontmatter
+
+    Raises:
+        AgentValidationError: If the file is not a valid agent file
+        yaml.YAMLError: If the frontmatter is not valid YAML
+    """
+    # Check file extension
+    if not path.suffix == ".md":
+        raise AgentValidationError("Agent file must have .md extension")
+
+    with open(path) as f:
+        if f.read(3) != "---":
+            raise AgentValidationError("Agent file must start with YAML frontmatter (---)")
+
+        # Read only up to the closing "---"; the agent body is never loaded
+        frontmatter_text = ""
+        end = -1
+        while end < 0:
+            chunk = f.read(FRONTMATTER_HEAD_BYTES)
+            if not chunk:
+                break
+            # Re-scan the tail in case the delimiter straddles chunks
+            start = max(0, len(frontmatter_text) - 2)
+            frontmatter_text += chunk
+            end = frontmatter_text.find("---", start)
+
+    if end < 0:
+        raise AgentValidationError("Invalid frontmatter format")
+
+    frontmatter = parse_frontmatter_text(frontmatter_text[:end])
+
+    # Validate required fields
+    required_fields = ["name", "description", "model"]
+    missing_fields = [f for f in required_fields if f not in frontmatter]
+    if missing_fields:
+        raise AgentValidationError(f"Missing required fields: {', '.join(missing_fields)}")
+
+    # Validate name, description and model
+    for field, check in (
+        ("name", validator.validate_agent_name),
+        ("description", validator.validate_description),
+        ("model", validator.validate_model),
+    ):
+        is_valid, error = check(frontmatter[field])
+        if not is_valid:
+            raise AgentValidationError(f"Invalid {field}: {error}")
 
-        frontmatter = yaml.safe_load(parts[1])
+    return frontmatter
 
-        # Validate required fields
-        required_fields = ["name", "description", "model"]
-        missing_fields = [f for f in required_fields if f not in frontmatter]
 
-        if missing_fields:
-            click.echo(f"❌ Missing required fields: {', '.join(missing_fields)}", err=True)
-            raise click.Abort()
-
-        # Validate name
-        from src.tools.agent_builder.validator import AgentValidator
+@cli.command()
+@click.argument("agent_paths", nargs=-1, type=click.Path(exists=True))
+@click.option(
+    "--glob",
+    "patterns",
+    multiple=True,
+    help="Also validate files matching this pattern (quote it; ** matches subdirectories)",
+)
+def validate(agent_paths: Tuple[str, ...], patterns: Tuple[str, ...]) -> None:
+    """Validate agent markdown files.
+
+    Several files are checked in one run, so CI hooks pay the interpreter
+    and import startup once. Exits non-zero if any file is invalid.
+    """
+    paths = [Path(p) for p in agent_paths]
+    for pattern in patterns:
+        paths.extend(Path(p) for p in sorted(glob.iglob(pattern, recursive=True)))
+
+    if not paths:
+        click.echo("❌ No agent files to validate", err=True)
+        raise click.Abort()
 
-        is_valid, error = AgentValidator.validate_agent_name(frontmatter["name"])
-        if not is_valid:
-            click.echo(f"❌ Invalid name: {error}", err=True)
-            raise click.Abort()
+    from src.tools.agent_builder.validator import AgentValidator
 
-        # Validate description
-        is_valid, error = AgentValidator.validate_description(frontmatter["description"])
-        if not is_valid:
-            click.echo(f"❌ Invalid description: {error}", err=True)
-            raise click.Abort()
+    invalid = 0
+    for path in paths:
+        try:
+            frontmatter = _check_agent_file(path, AgentValidator)
+        except AgentValidationError as e:
+            error = str(e)
+        except yaml.YAMLError as e:
+            error = f"YAML parsing error: {e}"
+        except Exception as e:
+            error = f"Validation error: {e}"
+        else:
+            click.echo(f"\n✅ Agent file '{path.name}' is valid!")
+            click.echo(f"\n  Name:        {frontmatter['name']}")
+            click.echo(f"  Description: {frontmatter['description']}")
+            click.echo(f"  Model:       {frontmatter['model']}")
 
-        # Validate model
-        is_valid, error = AgentValidator.validate_model(frontmatter["model"])
-        if not is_valid:
-            click.echo(f"❌ Invalid model: {error}", err=True)
-            raise click.Abort()
+            if "template" in frontmatter:
+                click.echo(f"  Template:    {frontmatter['template']}")
 
-        # All validations passed
-        click.echo(f"\n✅ Agent file '{path.name}' is valid!")
-        click.echo(f"\n  Name:        {frontmatter['name']}")
-        click.echo(f"  Description: {frontmatter['description']}")
-        click.echo(f"  Model:       {frontmatter['model']}")
+            if len(paths) == 1:
+                click.echo("\n💡 Agent is ready to use in Claude Code")
+            continue
 
-        if "template" in frontmatter:
-            click.echo(f"  Template:    {frontmatter['template']}")
+        invalid += 1
+        prefix = f"{path}: " if len(paths) > 1 else ""
+        click.echo(f"❌ {prefix}{error}", err=True)
 
-        click.echo("\n💡 Agent is ready to use in Claude Code")
+    if len(paths) > 1:
+        click.echo(f"\n📊 {len(paths) - invalid} valid, {invalid} invalid")
 
-    except yaml.YAMLError as e:
-        click.echo(f"❌ YAML parsing error: {e}", err=True)
-        raise click.Abort()
-    except Exception as e:
-        click.echo(f"❌ Validation error: {e}", err=True)
+    if invalid:
         raise click.Abort()
 
 
@@ -5,14 +5,35 @@ This module defines the core data structures for agent configuration,
 catalog entries, and catalog management using Pydantic v2 for validation.
 """
 
+import os
 import re
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, ValidationInfo, field_validator
+
+# Validation context for catalog data read back from disk. Entries were
+# validated when they were written, so format checks are skipped on load.
+TRUSTED_CONTEXT: Dict[str, Any] = {"trusted": True}
+
+
+def _is_trusted(info: ValidationInfo) -> bool:
+    """Return True when validating data under TRUSTED_CONTEXT."""
+    return bool(info.context and info.context.get("trusted"))
+
+
+# Every name rule in one pattern: 1-64 chars of [a-z0-9-], no leading,
+# trailing or consecutive hyphens. Names that fail it are re-checked rule by
+# rule only to pick the error message.
+_NAME_RE = re.compile(r"(?!-)(?!.*--)[a-z0-9-]{1,64}(?<!-)")
+_NAME_CHARS_RE = re.compile(r"^[a-z0-9-]+$")
+_TEMPLATE_RE = re.compile(r"^[a-z0-9_-]+$")
+
+# Substring match on the lowercased description, as in "Use when..."
+_USAGE_RE = re.compile("when|use|for|during|if")
 
 
 class ScopeType(str, Enum):
@@ -61,14 +82,16 @@ class AgentConfig(BaseModel):
 
         Security: Prevents path traversal and special characters
         """
+        if _NAME_RE.fullmatch(v):
+            return v
+
         if not v or len(v) > 64:
             raise ValueError("Name must be 1-64 characters")
 
         if not v or len(v) < 1:
             raise ValueError("Name cannot be empty")
 
-        pattern = re.compile(r"^[a-z0-9-]+$")
-        if not pattern.match(v):
+        if not _NAME_CHARS_RE.match(v):
             raise ValueError("Name must contain only lowercase letters, numbers, and hyphens")
 
         if v.startswith("-") or v.endswith("-"):
@@ -85,17 +108,14 @@ class AgentConfig(BaseModel):
         """
         Validates description (max 1024 chars, must include usage context).
         """
-        if not v or len(v.strip()) == 0:
+        if not v or v.isspace():
             raise ValueError("Description cannot be empty")
 
         if len(v) > 1024:
             raise ValueError("Description must be 1024 characters or less")
 
         # Check for usage context keywords
-        usage_keywords = ["when", "use", "for", "during", "if"]
-        has_usage_context = any(keyword in v.lower() for keyword in usage_keywords)
-
-        if not has_usage_context:
+        if not _USAGE_RE.search(v.lower()):
             raise ValueError(
                 "Description should include when to use this agent "
                 "(e.g., 'Use when...', 'for processing...')"
@@ -114,8 +134,7 @@ class AgentConfig(BaseModel):
         if ".." in v or "/" in v or "\\" in v:
             raise ValueError("Template name cannot contain path separators")
 
-        pattern = re.compile(r"^[a-z0-9_-]+$")
-        if not pattern.match(v):
+        if not _TEMPLATE_RE.match(v):
             raise ValueError(
                 "Template name must contain only lowercase letters, "
                 "numbers, underscores, and hyphens"
@@ -148,7 +167,7 @@ class AgentCatalogEntry(BaseModel):
         description: Agent description
         scope: Installation scope
         model: Claude model used by this agent
-        path: Absolute path to agent file
+        path: Absolute path to agent file (kept as a string; see path_obj)
         created_at: Creation timestamp
         updated_at: Last update timestamp
         metadata: Additional metadata (template, version, etc.)
@@ -159,20 +178,156 @@ class AgentCatalogEntry(BaseModel):
     description: str
     scope: ScopeType
     model: ModelType
-    path: Path
+    path: str
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
-    @field_validator("path")
+    @field_validator("path", mode="before")
     @classmethod
-    def validate_path(cls, v: Path) -> Path:
-        """Ensures path is absolute."""
-        if not v.is_absolute():
+    def validate_path(cls, v: Any, info: ValidationInfo) -> Any:
+        """Accepts Path objects and ensures the path is absolute.
+
+        The absolute-path check runs on write, not on trusted loads.
+        """
+        if isinstance(v, os.PathLike):
+            v = os.fspath(v)
+        if isinstance(v, str) and not _is_trusted(info) and not os.path.isabs(v):
             raise ValueError("Path must be absolute")
         return v
 
-    model_config = {"json_encoders": {Path: str, UUID: str, datetime: lambda v: v.isoformat()}}
+    @property
+    def path_obj(self) -> Path:
+        """Agent file path as a Path, for callers that touch the file."""
+        return Path(self.path)
+
+    # Assignments are not re-validated; AgentCatalog.update_agent writes
+    # fields straight into the instance, so callers pass checked values
+    model_config = {
+        "json_encoders": {Path: str, UUID: str, datetime: lambda v: v.isoformat()},
+        "validate_assignment": False,
+    }
+
+
+# Entry fields AgentCatalog.update_agent may change; other keys are ignored
+_UPDATABLE_FIELDS = frozenset({"name", "description", "scope", "model", "path", "metadata"})
+
+
+# Scanning the cached lowercase text costs roughly 1/200 of building the
+# trigram index, so the index only pays off for long-lived processes that
+# search the same catalog repeatedly; one-shot CLI searches just scan
+TRIGRAM_INDEX_MIN_SEARCHES = 200
+
+
+def _add_trigrams(trigrams: Dict[str, Set[int]], pos: int, texts: Tuple[str, str]) -> None:
+    """Record every trigram of ``texts`` as occurring at list position ``pos``."""
+    for text in texts:
+        for i in range(len(text) - 2):
+            trigrams.setdefault(text[i : i + 3], set()).add(pos)
+
+
+class _AgentIndex:
+    """
+    Lookup and search indexes over an AgentCatalog's ``agents`` list.
+
+    A plain object held in one private attribute, so each catalog call pays
+    for a single pydantic private-attribute lookup rather than one per index.
+    """
+
+    __slots__ = (
+        "source",
+        "count",
+        "by_id",
+        "by_name",
+        "by_name_scope",
+        "by_scope",
+        "search_text",
+        "trigrams",
+        "scans",
+    )
+
+    def __init__(self) -> None:
+        # The list object and length the indexes were built from
+        self.source: Optional[List[AgentCatalogEntry]] = None
+        self.count = 0
+
+        # Scope and name buckets are dicts keyed by agent id: catalog order is
+        # kept and a single entry can be dropped without scanning
+        self.by_id: Dict[UUID, AgentCatalogEntry] = {}
+        self.by_name: Dict[str, Dict[UUID, AgentCatalogEntry]] = {}
+        self.by_name_scope: Dict[Tuple[str, ScopeType], AgentCatalogEntry] = {}
+        self.by_scope: Dict[ScopeType, Dict[UUID, AgentCatalogEntry]] = {}
+
+        # Text search: lowercased (name, description) per position in agents,
+        # built on the first search; trigram -> positions, built once the
+        # catalog has been scanned TRIGRAM_INDEX_MIN_SEARCHES times
+        self.search_text: Optional[List[Tuple[str, str]]] = None
+        self.trigrams: Optional[Dict[str, Set[int]]] = None
+        self.scans = 0
+
+    def rebuild(self, agents: List[AgentCatalogEntry]) -> None:
+        """Index ``agents`` from scratch."""
+        self.by_id = {}
+        self.by_name = {}
+        self.by_name_scope = {}
+        self.by_scope = {}
+        for agent in agents:
+            self.add(agent)
+
+        self.source = agents
+        self.count = len(agents)
+        self.search_text = None
+
+    def add(self, agent: AgentCatalogEntry) -> None:
+        """Index one agent appended at the end of the list."""
+        self.by_id[agent.id] = agent
+        self.by_name.setdefault(agent.name, {})[agent.id] = agent
+        # First entry wins, matching a front-to-back scan
+        self.by_name_scope.setdefault((agent.name, agent.scope), agent)
+        self.by_scope.setdefault(agent.scope, {})[agent.id] = agent
+
+    def remove(self, agent: AgentCatalogEntry) -> None:
+        """Drop one agent from the lookup indexes."""
+        self.by_id.pop(agent.id, None)
+        self.by_scope.get(agent.scope, {}).pop(agent.id, None)
+
+        same_name = self.by_name.get(agent.name, {})
+        same_name.pop(agent.id, None)
+        if not same_name:
+            self.by_name.pop(agent.name, None)
+
+        key = (agent.name, agent.scope)
+        if self.by_name_scope.get(key) is agent:
+            # Promote the next entry with the same name and scope, if any
+            replacement = next((a for a in same_name.values() if a.scope == agent.scope), None)
+            if replacement is None:
+                del self.by_name_scope[key]
+            else:
+                self.by_name_scope[key] = replacement
+
+    def add_search_text(self, pos: int, agent: AgentCatalogEntry) -> None:
+        """Add the agent at ``pos`` in the list to the text search data."""
+        texts = (agent.name.lower(), agent.description.lower())
+        self.search_text.append(texts)
+        if self.trigrams is not None:
+            _add_trigrams(self.trigrams, pos, texts)
+
+    def ensure_search(self, agents: List[AgentCatalogEntry]) -> List[Tuple[str, str]]:
+        """Lowercase every name and description once and return the texts."""
+        if self.search_text is None:
+            self.search_text = [(a.name.lower(), a.description.lower()) for a in agents]
+            self.trigrams = None
+            self.scans = 0
+        return self.search_text
+
+    def ensure_trigrams(self) -> Dict[str, Set[int]]:
+        """Build the trigram index over the lowercased texts if needed."""
+        if self.trigrams is None:
+            trigrams: Dict[str, Set[int]] = {}
+            for pos, texts in enumerate(self.search_text):
+                _add_trigrams(trigrams, pos, texts)
+            self.trigrams = trigrams
+        return self.trigrams
 
 
 class AgentCatalog(BaseModel):
@@ -182,6 +337,10 @@ class AgentCatalog(BaseModel):
     Provides methods for managing the collection of agents,
     including search, retrieval, and filtering operations.
 
+    Lookups go through private id/name/scope indexes. add_agent, remove_agent
+    and update_agent keep them current; if ``agents`` is replaced or resized
+    directly they are rebuilt on the next lookup.
+
     Attributes:
         schema_version: Catalog schema version
         agents: List of agent catalog entries
@@ -190,6 +349,18 @@ class AgentCatalog(BaseModel):
     schema_version: str = "1.0"
     agents: List[AgentCatalogEntry] = Field(default_factory=list)
 
+    _index: _AgentIndex = PrivateAttr(default_factory=_AgentIndex)
+
+    def _current_index(self) -> _AgentIndex:
+        """Return the indexes, rebuilding them if ``agents`` changed behind their back."""
+        # Read the private dict directly: BaseModel.__getattr__ resolves private
+        # attributes through a slow descriptor probe on every access
+        index = self.__pydantic_private__["_index"]
+        agents = self.agents
+        if agents is not index.source or len(agents) != index.count:
+            index.rebuild(agents)
+        return index
+
     def get_by_id(self, agent_id: UUID) -> Optional[AgentCatalogEntry]:
         """
         Retrieves an agent by its UUID.
@@ -200,10 +371,7 @@ class AgentCatalog(BaseModel):
         Returns:
             AgentCatalogEntry if found, None otherwise
         """
-        for agent in self.agents:
-            if agent.id == agent_id:
-                return agent
-        return None
+        return self._current_index().by_id.get(agent_id)
 
     def get_by_name(
         self, name: str, scope: Optional[ScopeType] = None
@@ -218,16 +386,22 @@ class AgentCatalog(BaseModel):
         Returns:
             AgentCatalogEntry if found, None otherwise
         """
-        for agent in self.agents:
-            if agent.name == name:
-                if scope is None or agent.scope == scope:
-                    return agent
-        return None
+        index = self._current_index()
+        if scope is not None:
+            return index.by_name_scope.get((name, scope))
+
+        same_name = index.by_name.get(name)
+        return next(iter(same_name.values())) if same_name else None
 
     def search(self, query: str, scope: Optional[ScopeType] = None) -> List[AgentCatalogEntry]:
         """
         Searches agents by name and description.
 
+        Matching is a case-insensitive substring test over names and
+        descriptions lowercased once per catalog. After repeated searches,
+        queries of three or more characters narrow candidates through a
+        trigram index, so only agents containing every trigram are checked.
+
         Args:
             query: Search query string
             scope: Optional scope filter
@@ -235,17 +409,34 @@ class AgentCatalog(BaseModel):
         Returns:
             List of matching AgentCatalogEntry objects
         """
+        agents = self.agents
+        index = self._current_index()
+        texts = index.ensure_search(agents)
         query_lower = query.lower()
-        results = []
-
-        for agent in self.agents:
-            if scope and agent.scope != scope:
-                continue
 
-            if query_lower in agent.name.lower() or query_lower in agent.description.lower():
-                results.append(agent)
-
-        return results
+        positions: Iterable[int] = range(len(texts))
+        if len(query_lower) >= 3:
+            if index.trigrams is None and index.scans < TRIGRAM_INDEX_MIN_SEARCHES:
+                index.scans += 1
+            else:
+                trigrams = index.ensure_trigrams()
+                # Intersect posting sets, smallest first
+                postings = sorted(
+                    (
+                        trigrams.get(query_lower[i : i + 3], set())
+                        for i in range(len(query_lower) - 2)
+                    ),
+                    key=len,
+                )
+                positions = sorted(postings[0].intersection(*postings[1:]))
+
+        # Verify candidates in catalog order; trigrams only prove a superset
+        return [
+            agents[pos]
+            for pos in positions
+            if (not scope or agents[pos].scope == scope)
+            and (query_lower in texts[pos][0] or query_lower in texts[pos][1])
+        ]
 
     def filter_by_scope(self, scope: ScopeType) -> List[AgentCatalogEntry]:
         """
@@ -257,7 +448,7 @@ class AgentCatalog(BaseModel):
         Returns:
             List of agents in the specified scope
         """
-        return [a for a in self.agents if a.scope == scope]
+        return list(self._current_index().by_scope.get(scope, {}).values())
 
     def add_agent(self, entry: AgentCatalogEntry) -> None:
         """
@@ -269,11 +460,16 @@ class AgentCatalog(BaseModel):
         Raises:
             ValueError: If agent with same name and scope already exists
         """
-        existing = self.get_by_name(entry.name, entry.scope)
-        if existing:
+        index = self._current_index()
+        if (entry.name, entry.scope) in index.by_name_scope:
             raise ValueError(f"Agent '{entry.name}' already exists in {entry.scope} scope")
 
-        self.agents.append(entry)
+        agents = self.agents
+        agents.append(entry)
+        index.add(entry)
+        index.count = len(agents)
+        if index.search_text is not None:
+            index.add_search_text(len(agents) - 1, entry)
 
     def remove_agent(self, agent_id: UUID) -> bool:
         """
@@ -285,9 +481,46 @@ class AgentCatalog(BaseModel):
         Returns:
             True if removed, False if not found
         """
-        initial_count = len(self.agents)
-        self.agents = [a for a in self.agents if a.id != agent_id]
-        return len(self.agents) < initial_count
+        index = self._current_index()
+        agent = index.by_id.get(agent_id)
+        if agent is None:
+            return False
+
+        # Delete in place by identity: no new list, no field comparisons
+        agents = self.agents
+        for pos, candidate in enumerate(agents):
+            if candidate is agent:
+                del agents[pos]
+                break
+
+        index.remove(agent)
+        index.count = len(agents)
+        # Positions shift after a removal
+        index.search_text = None
+        return True
+
+    def remove_many(self, agent_ids: Set[UUID]) -> int:
+        """
+        Removes several agents in a single pass over the catalog.
+
+        Args:
+            agent_ids: UUIDs of agents to remove
+
+        Returns:
+            Number of agents removed
+        """
+        index = self._current_index()
+        removed = [index.by_id[agent_id] for agent_id in agent_ids if agent_id in index.by_id]
+        if not removed:
+            return 0
+
+        self.agents = [a for a in self.agents if a.id not in agent_ids]
+        for agent in removed:
+            index.remove(agent)
+        index.source = self.agents
+        index.count = len(self.agents)
+        index.search_text = None
+        return len(removed)
 
     def update_agent(self, agent_id: UUID, **updates: Any) -> bool:
         """
@@ -295,18 +528,29 @@ class AgentCatalog(BaseModel):
 
         Args:
             agent_id: UUID of agent to update
-            **updates: Fields to update
+            **updates: Fields to update (name, description, scope, model,
+                path, metadata); values are stored without re-validation
 
         Returns:
             True if updated, False if not found
         """
-        agent = self.get_by_id(agent_id)
+        index = self._current_index()
+        agent = index.by_id.get(agent_id)
         if not agent:
             return False
 
-        for key, value in updates.items():
-            if hasattr(agent, key):
-                setattr(agent, key, value)
+        fields = {key: value for key, value in updates.items() if key in _UPDATABLE_FIELDS}
+        if "path" in fields:
+            fields["path"] = os.fspath(fields["path"])
+        fields["updated_at"] = datetime.now()
+
+        # Write straight into the instance; assignment is not validated anyway
+        agent.__dict__.update(fields)
+        agent.__pydantic_fields_set__.update(fields)
 
-        agent.updated_at = datetime.now()
+        # Renames and scope moves change index keys and bucket order;
+        # rebuild on the next lookup rather than patching in place
+        if fields.keys() & {"name", "scope"}:
+            index.source = None
+        index.search_text = None
         return True
@@ -13,11 +13,16 @@ Security Focus:
 """
 
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Tuple
 
 from .models import ModelType
 
+# Results kept per string validator. The checks are pure functions of their
+# input, and the wizard re-validates the same text on every keystroke.
+VALIDATION_CACHE_SIZE = 256
+
 
 class AgentValidator:
     """
@@ -30,13 +35,48 @@ class AgentValidator:
     # Agent name pattern: lowercase, numbers, hyphens only
     AGENT_NAME_PATTERN = re.compile(r"^[a-z0-9-]+$")
 
+    # Every agent name rule in one pattern: 1-64 chars of [a-z0-9-], no
+    # leading, trailing or consecutive hyphens. Names that fail it are
+    # re-checked rule by rule only to pick the error message.
+    VALID_AGENT_NAME_PATTERN = re.compile(r"(?!-)(?!.*--)[a-z0-9-]{1,64}(?<!-)")
+
     # Template name pattern: lowercase, numbers, underscores, hyphens
     TEMPLATE_NAME_PATTERN = re.compile(r"^[a-z0-9_-]+$")
 
+    # Same charset as a set; issuperset() beats the regex on short names
+    TEMPLATE_NAME_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_-")
+
+    # Frontmatter key pattern: alphanumeric, underscores, hyphens
+    SAFE_KEY_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
+
+    # Usage context keywords, matched as substrings of the lowercased
+    # description ("Use when...", "for processing...")
+    USAGE_CONTEXT_PATTERN = re.compile("when|use|for|during|if|while")
+
+    # Safe filename: alphanumeric, hyphen, underscore, dot; never ".."
+    SAFE_FILENAME_PATTERN = re.compile(r"^(?!.*\.\.)[a-zA-Z0-9._-]+$")
+
+    # Reserved device names on Windows, compared without extension
+    RESERVED_FILENAMES = frozenset(
+        {"CON", "PRN", "AUX", "NUL"}
+        | {f"COM{i}" for i in range(1, 10)}
+        | {f"LPT{i}" for i in range(1, 10)}
+    )
+
+    # str.translate table deleting Latin-1 control characters other than
+    # whitespace; sanitize_string falls back to a per-char scan beyond it
+    CONTROL_CHAR_TABLE = dict.fromkeys(
+        c for c in range(0x100) if not (chr(c).isprintable() or chr(c).isspace())
+    )
+
     # Valid Claude models (from ModelType enum)
-    VALID_MODELS = {model.value for model in ModelType}
+    VALID_MODELS = frozenset(model.value for model in ModelType)
+
+    # Listed in the invalid-model error; built once, not on every retry
+    VALID_MODELS_LIST = ", ".join(sorted(VALID_MODELS))
 
     @staticmethod
+    @lru_cache(maxsize=VALIDATION_CACHE_SIZE)
     def validate_agent_name(name: str) -> Tuple[bool, str]:
         """
         Validates agent name follows pattern: ^[a-z0-9-]{1,64}$
@@ -62,28 +102,48 @@ class AgentValidator:
         if not name or len(name) < 1:
             return False, "Name cannot be empty"
 
+        # Fast path: one regex call settles every valid name
+        if AgentValidator.VALID_AGENT_NAME_PATTERN.fullmatch(name):
+            return True, "Valid agent name"
+
+        error = AgentValidator._agent_name_error(name)
+        if error:
+            return False, error
+
+        return True, "Valid agent name"
+
+    @staticmethod
+    def _agent_name_error(name: str) -> Optional[str]:
+        """
+        Finds which rule a non-empty agent name breaks, checked in priority order.
+
+        Only called for names VALID_AGENT_NAME_PATTERN rejected; returns None
+        for the few it rejects but the granular rules accept (a trailing
+        newline, which ``$`` tolerates).
+        """
         if len(name) > 64:
-            return False, "Name must be 1-64 characters"
+            return "Name must be 1-64 characters"
 
         # Security: Explicit path traversal check (BEFORE pattern check)
         if ".." in name or "/" in name or "\\" in name:
-            return False, "Name cannot contain path separators or '..'"
+            return "Name cannot contain path separators or '..'"
 
         # Check pattern
         if not AgentValidator.AGENT_NAME_PATTERN.match(name):
-            return False, "Name must contain only lowercase letters, numbers, and hyphens"
+            return "Name must contain only lowercase letters, numbers, and hyphens"
 
         # Security: Check for leading/trailing hyphens
         if name.startswith("-") or name.endswith("-"):
-            return False, "Name cannot start or end with hyphen"
+            return "Name cannot start or end with hyphen"
 
         # Security: Check for consecutive hyphens
         if "--" in name:
-            return False, "Name cannot contain consecutive hyphens"
+            return "Name cannot contain consecutive hyphens"
 
-        return True, "Valid agent name"
+        return None
 
     @staticmethod
+    @lru_cache(maxsize=VALIDATION_CACHE_SIZE)
     def validate_description(description: str) -> Tuple[bool, str]:
         """
         Validates description (max 1024 chars, must include usage context).
@@ -103,19 +163,17 @@ class AgentValidator:
             >>> AgentValidator.validate_description("A planning agent.")
             (False, "Description should include when to use this agent...")
         """
-        # Check empty
-        if not description or len(description.strip()) == 0:
+        # Check empty; isspace() stops at the first non-space character
+        # instead of copying the whole string like strip()
+        if not description or description.isspace():
             return False, "Description cannot be empty"
 
         # Check length
         if len(description) > 1024:
             return False, "Description must be 1024 characters or less"
 
-        # Check for usage context keywords
-        usage_keywords = ["when", "use", "for", "during", "if", "while"]
-        has_usage_context = any(keyword in description.lower() for keyword in usage_keywords)
-
-        if not has_usage_context:
+        # Check for usage context keywords in one scan
+        if not AgentValidator.USAGE_CONTEXT_PATTERN.search(description.lower()):
             return False, (
                 "Description should include when to use this agent "
                 "(e.g., 'Use when...', 'for processing...', 'if working with...')"
@@ -124,6 +182,7 @@ class AgentValidator:
         return True, "Valid description"
 
     @staticmethod
+    @lru_cache(maxsize=VALIDATION_CACHE_SIZE)
     def validate_model(model: str) -> Tuple[bool, str]:
         """
         Validates model against whitelist of supported Claude models.
@@ -147,12 +206,12 @@ class AgentValidator:
             return False, "Model cannot be empty"
 
         if model not in AgentValidator.VALID_MODELS:
-            valid_list = ", ".join(sorted(AgentValidator.VALID_MODELS))
-            return False, f"Invalid model. Must be one of: {valid_list}"
+            return False, f"Invalid model. Must be one of: {AgentValidator.VALID_MODELS_LIST}"
 
         return True, f"Valid model: {model}"
 
     @staticmethod
+    @lru_cache(maxsize=VALIDATION_CACHE_SIZE)
     def validate_template_name(name: str) -> Tuple[bool, str]:
         """
         Validates template name (alphanumeric, underscores, hyphens only).
@@ -175,18 +234,23 @@ class AgentValidator:
         if not name:
             return False, "Template name cannot be empty"
 
-        # Security: Prevent path traversal (check BEFORE pattern check)
+        # Fast path: plain charset test; "." and separators are outside it,
+        # so a pass also rules out path traversal
+        if AgentValidator.TEMPLATE_NAME_CHARS.issuperset(name):
+            return True, "Valid template name"
+
+        # Security: Report path traversal ahead of the generic pattern error
         if ".." in name or "/" in name or "\\" in name:
             return False, "Template name cannot contain path separators"
 
-        # Check pattern
-        if not AgentValidator.TEMPLATE_NAME_PATTERN.match(name):
-            return False, (
-                "Template name must contain only lowercase letters, numbers, "
-                "underscores, and hyphens"
-            )
+        # Check pattern (which also tolerates a trailing newline)
+        if AgentValidator.TEMPLATE_NAME_PATTERN.match(name):
+            return True, "Valid template name"
 
-        return True, "Valid template name"
+        return False, (
+            "Template name must contain only lowercase letters, numbers, "
+            "underscores, and hyphens"
+        )
 
     @staticmethod
     def validate_path_security(path: Path, base_dir: Path) -> Tuple[bool, str]:
@@ -210,18 +274,23 @@ class AgentValidator:
             >>> AgentValidator.validate_path_security(Path("/etc/passwd"), base)
             (False, "Path is outside allowed directory")
         """
+        # resolve() costs a few syscalls but follows symlinks; a lexical
+        # normpath/startswith check would accept a link inside base_dir
+        # that points outside it. Callers validate one path per write.
+        # base_dir comes from the caller, so errors resolving it propagate.
+        resolved_base = base_dir.resolve()
+
         try:
             resolved_path = path.resolve()
-            resolved_base = base_dir.resolve()
-
-            # Check if path is relative to base
-            if not resolved_path.is_relative_to(resolved_base):
-                return False, "Path is outside allowed directory"
+        except (OSError, ValueError, RuntimeError) as e:
+            # ValueError: embedded null byte; RuntimeError: symlink loop (Python < 3.13)
+            return False, f"Path validation error: {e}"
 
-            return True, "Path is secure"
+        # Check if path is relative to base
+        if not resolved_path.is_relative_to(resolved_base):
+            return False, "Path is outside allowed directory"
 
-        except Exception as e:
-            return False, f"Path validation error: {str(e)}"
+        return True, "Path is secure"
 
     @staticmethod
     def validate_frontmatter_keys(frontmatter: Optional[dict]) -> Tuple[bool, str]:
@@ -240,13 +309,14 @@ class AgentValidator:
         if not frontmatter:
             return True, "No frontmatter to validate"
 
-        # Pattern for safe keys: alphanumeric, underscores, hyphens
-        safe_key_pattern = re.compile(r"^[a-zA-Z0-9_-]+$")
-
-        invalid_keys = [key for key in frontmatter.keys() if not safe_key_pattern.match(str(key))]
+        # Keys are almost always str already; only convert the others
+        match = AgentValidator.SAFE_KEY_PATTERN.match
+        invalid_keys = [
+            key for key in frontmatter if not match(key if isinstance(key, str) else str(key))
+        ]
 
         if invalid_keys:
-            return False, f"Invalid frontmatter keys: {', '.join(invalid_keys)}"
+            return False, f"Invalid frontmatter keys: {', '.join(map(str, invalid_keys))}"
 
         return True, "Valid frontmatter keys"
 
@@ -270,7 +340,14 @@ class AgentValidator:
             return ""
 
         # Remove control characters except whitespace
-        sanitized = "".join(char if char.isprintable() or char.isspace() else "" for char in value)
+        sanitized = value
+        if not value.isprintable():
+            sanitized = value.translate(AgentValidator.CONTROL_CHAR_TABLE)
+            # Rare non-Latin-1 leftovers (format chars, unassigned code points)
+            if not "".join(sanitized.split()).isprintable():
+                sanitized = "".join(
+                    char for char in sanitized if char.isprintable() or char.isspace()
+                )
 
         # Normalize whitespace
         sanitized = " ".join(sanitized.split())
@@ -282,6 +359,7 @@ class AgentValidator:
         return sanitized
 
     @staticmethod
+    @lru_cache(maxsize=VALIDATION_CACHE_SIZE)
     def is_safe_filename(filename: str) -> Tuple[bool, str]:
         """
         Checks if filename is safe for filesystem operations.
@@ -303,42 +381,18 @@ class AgentValidator:
         if not filename:
             return False, "Filename cannot be empty"
 
+        # Fast path: safe charset with no "..", then only the reserved check
+        if AgentValidator.SAFE_FILENAME_PATTERN.match(filename):
+            if filename.partition(".")[0].upper() in AgentValidator.RESERVED_FILENAMES:
+                return False, f"Filename '{filename}' is a reserved name"
+            return True, "Safe filename"
+
         # Check for path traversal
         if ".." in filename or "/" in filename or "\\" in filename:
             return False, "Filename contains path traversal"
 
         # Check for reserved names (Windows)
-        reserved_names = {
-            "CON",
-            "PRN",
-            "AUX",
-            "NUL",
-            "COM1",
-            "COM2",
-            "COM3",
-            "COM4",
-            "COM5",
-            "COM6",
-            "COM7",
-            "COM8",
-            "COM9",
-            "LPT1",
-            "LPT2",
-            "LPT3",
-            "LPT4",
-            "LPT5",
-            "LPT6",
-            "LPT7",
-            "LPT8",
-            "LPT9",
-        }
-
-        name_without_ext = filename.split(".")[0].upper()
-        if name_without_ext in reserved_names:
+        if filename.partition(".")[0].upper() in AgentValidator.RESERVED_FILENAMES:
             return False, f"Filename '{filename}' is a reserved name"
 
-        # Check for special characters (allow alphanumeric, hyphen, underscore, dot)
-        if not re.match(r"^[a-zA-Z0-9._-]+$", filename):
-            return False, "Filename contains invalid characters"
-
-        return True, "Safe filename"
+        return False, "Filename contains invalid characters"
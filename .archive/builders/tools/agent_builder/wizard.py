@@ -13,12 +13,11 @@ This wizard guides users through:
 6. Preview and confirmation
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, List, Optional, Tuple, Union
 
 import click
-import questionary
-from questionary import Style
 
 from src.tools.agent_builder.builder import AgentBuilder
 from src.tools.agent_builder.catalog import CatalogManager
@@ -27,22 +26,81 @@ from src.tools.agent_builder.models import AgentConfig, ScopeType, ModelType
 from src.tools.agent_builder.templates import TemplateManager
 from src.tools.agent_builder.validator import AgentValidator
 
-# Custom style for questionary prompts (Claude Code aesthetics)
-CUSTOM_STYLE = Style(
-    [
-        ("qmark", "fg:#673ab7 bold"),
-        ("question", "bold"),
-        ("answer", "fg:#2196f3 bold"),
-        ("pointer", "fg:#673ab7 bold"),
-        ("highlighted", "fg:#673ab7 bold"),
-        ("selected", "fg:#2196f3"),
-        ("separator", "fg:#cc5454"),
-        ("instruction", "fg:#858585"),
-        ("text", ""),
-        ("disabled", "fg:#858585 italic"),
-    ]
+# questionary pulls in prompt_toolkit and pygments, so it is imported by the
+# prompts that use it rather than when this module is imported.
+
+# Custom style rules for questionary prompts (Claude Code aesthetics)
+_STYLE_RULES = [
+    ("qmark", "fg:#673ab7 bold"),
+    ("question", "bold"),
+    ("answer", "fg:#2196f3 bold"),
+    ("pointer", "fg:#673ab7 bold"),
+    ("highlighted", "fg:#673ab7 bold"),
+    ("selected", "fg:#2196f3"),
+    ("separator", "fg:#cc5454"),
+    ("instruction", "fg:#858585"),
+    ("text", ""),
+    ("disabled", "fg:#858585 italic"),
+]
+
+
+@lru_cache(maxsize=None)
+def _custom_style() -> Any:
+    """Build the questionary Style on first use."""
+    from questionary import Style
+
+    return Style(_STYLE_RULES)
+
+
+def __getattr__(name: str) -> Any:
+    """Build CUSTOM_STYLE lazily for code that imports it (PEP 562)."""
+    if name == "CUSTOM_STYLE":
+        return _custom_style()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# questionary select() choices, built once at import rather than per prompt
+_SCOPE_CHOICES = (
+    {"name": "🌐 global - Available in all projects", "value": ScopeType.GLOBAL},
+    {"name": "📦 project - Available in this project (committed)", "value": ScopeType.PROJECT},
+    {"name": "💻 local - Available locally (not committed)", "value": ScopeType.LOCAL},
+)
+
+_MODEL_CHOICES = (
+    {
+        "name": "⚡ Haiku (claude-3-5-haiku-20241022) - Fast, cost-effective",
+        "value": ModelType.HAIKU,
+    },
+    {
+        "name": "🎯 Sonnet (claude-3-5-sonnet-20241022) - Recommended",
+        "value": ModelType.SONNET,
+    },
+    {
+        "name": "🧠 Opus (claude-opus-4-20250514) - Most capable",
+        "value": ModelType.OPUS,
+    },
 )
 
+_TEMPLATE_CHOICES = (
+    {"name": "📝 basic - Standard agent template (recommended)", "value": "basic"},
+    {"name": "🚀 advanced - Advanced agent features", "value": "advanced"},
+)
+
+
+def _prompt_validator(
+    check: Callable[[str], Tuple[bool, str]],
+) -> Callable[[str], Union[bool, str]]:
+    """Adapt an AgentValidator check to questionary's validate= callback.
+
+    The check runs once per keystroke; questionary takes True or the error text.
+    """
+
+    def validate(text: str) -> Union[bool, str]:
+        is_valid, message = check(text)
+        return True if is_valid else message
+
+    return validate
+
 
 class AgentWizard:
     """Interactive wizard for creating Claude Code agents."""
@@ -147,24 +205,14 @@ class AgentWizard:
         click.echo("\n💡 Naming convention: lowercase-with-hyphens")
         click.echo("   Examples: plan-agent, code-reviewer, feature-implementer\n")
 
-        while True:
-            name = questionary.text(
-                "Agent name (lowercase-with-hyphens):",
-                style=CUSTOM_STYLE,
-                validate=lambda text: AgentValidator.validate_agent_name(text)[0]
-                or AgentValidator.validate_agent_name(text)[1],
-            ).ask()
+        import questionary
 
-            if name is None:  # User cancelled
-                return None
-
-            # Validate agent name
-            is_valid, error = AgentValidator.validate_agent_name(name)
-            if not is_valid:
-                click.echo(f"❌ {error}", err=True)
-                continue
-
-            return name
+        # questionary only returns once validate= accepts the input
+        return questionary.text(
+            "Agent name (lowercase-with-hyphens):",
+            style=_custom_style(),
+            validate=_prompt_validator(AgentValidator.validate_agent_name),
+        ).ask()
 
     def _prompt_description(self) -> Optional[str]:
         """
@@ -182,26 +230,19 @@ class AgentWizard:
         click.echo("\n💡 Include when to use this agent:")
         click.echo('   Examples: "Use when...", "for defining...", "during planning..."\n')
 
-        while True:
-            description = questionary.text(
-                "Agent description (what does it do and when to use it):",
-                style=CUSTOM_STYLE,
-                validate=lambda text: len(text.strip()) > 0 or "Description cannot be empty",
-            ).ask()
+        import questionary
 
-            if description is None:  # User cancelled
-                return None
+        # questionary only returns once validate= accepts the input
+        description = questionary.text(
+            "Agent description (what does it do and when to use it):",
+            style=_custom_style(),
+            validate=_prompt_validator(AgentValidator.validate_description),
+        ).ask()
 
-            # Validate description (must include usage context)
-            is_valid, error = AgentValidator.validate_description(description)
-            if not is_valid:
-                click.echo(f"❌ {error}", err=True)
-                click.echo(
-                    '   Tip: Add "Use when..." or "for..." to describe when Claude should use this agent\n'
-                )
-                continue
+        if description is None:  # User cancelled
+            return None
 
-            return description.strip()
+        return description.strip()
 
     def _prompt_scope(self) -> Optional[ScopeType]:
         """
@@ -219,20 +260,12 @@ class AgentWizard:
         click.echo("   • project: Available in this project (.claude/agents/, committed)")
         click.echo("   • local: Available locally (.claude/agents/, not committed)\n")
 
+        import questionary
+
         choice = questionary.select(
             "Installation scope:",
-            choices=[
-                {"name": "🌐 global - Available in all projects", "value": ScopeType.GLOBAL},
-                {
-                    "name": "📦 project - Available in this project (committed)",
-                    "value": ScopeType.PROJECT,
-                },
-                {
-                    "name": "💻 local - Available locally (not committed)",
-                    "value": ScopeType.LOCAL,
-                },
-            ],
-            style=CUSTOM_STYLE,
+            choices=list(_SCOPE_CHOICES),
+            style=_custom_style(),
         ).ask()
 
         return choice
@@ -253,23 +286,12 @@ class AgentWizard:
         click.echo("   • Sonnet: Balanced performance and quality (recommended)")
         click.echo("   • Opus: Most capable for complex reasoning\n")
 
+        import questionary
+
         choice = questionary.select(
             "Claude model:",
-            choices=[
-                {
-                    "name": "⚡ Haiku (claude-3-5-haiku-20241022) - Fast, cost-effective",
-                    "value": ModelType.HAIKU,
-                },
-                {
-                    "name": "🎯 Sonnet (claude-3-5-sonnet-20241022) - Recommended",
-                    "value": ModelType.SONNET,
-                },
-                {
-                    "name": "🧠 Opus (claude-opus-4-20250514) - Most capable",
-                    "value": ModelType.OPUS,
-                },
-            ],
-            style=CUSTOM_STYLE,
+            choices=list(_MODEL_CHOICES),
+            style=_custom_style(),
         ).ask()
 
         return choice
@@ -292,13 +314,12 @@ class AgentWizard:
         # Get available templates
         available_templates = ["basic", "advanced"]  # Placeholder - templates not yet implemented
 
+        import questionary
+
         choice = questionary.select(
             "Agent template:",
-            choices=[
-                {"name": "📝 basic - Standard agent template (recommended)", "value": "basic"},
-                {"name": "🚀 advanced - Advanced agent features", "value": "advanced"},
-            ],
-            style=CUSTOM_STYLE,
+            choices=list(_TEMPLATE_CHOICES),
+            style=_custom_style(),
         ).ask()
 
         return choice
@@ -328,8 +349,10 @@ class AgentWizard:
         click.echo(f"  Template:    {config.template}")
         click.echo("\n" + "=" * 60 + "\n")
 
+        import questionary
+
         confirmed = questionary.confirm(
-            "Create this agent?", default=True, style=CUSTOM_STYLE
+            "Create this agent?", default=True, style=_custom_style()
         ).ask()
 
         return confirmed if confirmed is not None else False
@@ -382,7 +405,7 @@ class AgentWizard:
             click.echo(f"   Scope: {config.scope.value}")
             click.echo(f"   Model: {config.model.value}")
 
-            return entry.path
+            return entry.path_obj
 
         except AgentBuilderError as e:
             click.echo(f"\n❌ Failed to create agent: {e}", err=True)
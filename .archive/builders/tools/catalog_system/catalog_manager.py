@@ -5,12 +5,24 @@ Coordinates Scanner, Searcher, and Syncer components to provide
 a unified API for catalog management.
 """
 
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import List, Optional, Dict, Any, cast
+from typing import Iterator, List, Optional, Dict, Any, Tuple, Type, Union, cast
+
+from pydantic import TypeAdapter, ValidationError
 
 from .scanner import Scanner
 from .searcher import Searcher
-from .syncer import Syncer
+from .syncer import Syncer, read_catalog_file
 from .models import (
     CatalogEntry,
     SkillCatalogEntry,
@@ -19,6 +31,71 @@ from .models import (
 )
 from src.core.scope_manager import ScopeManager
 
+# Stream large catalogs entry by entry when ijson is installed
+try:
+    import ijson  # type: ignore[import-untyped]
+
+    IJSON_AVAILABLE = True
+    _STREAM_ERRORS: Tuple[Type[Exception], ...] = (ijson.JSONError,)
+except ImportError:
+    IJSON_AVAILABLE = False
+    _STREAM_ERRORS = ()
+
+logger = logging.getLogger(__name__)
+
+# Catalog files at least this large are streamed instead of parsed whole
+STREAM_MIN_BYTES = 8 * 1024 * 1024
+
+# Model class for the entries of each catalog file
+_ENTRY_TYPES: Dict[str, Type[CatalogEntry]] = {
+    "skills": SkillCatalogEntry,
+    "commands": CommandCatalogEntry,
+    "agents": AgentCatalogEntry,
+}
+
+# Scanner method that discovers each element type
+_SCAN_METHODS = {
+    "skills": "scan_skills",
+    "commands": "scan_commands",
+    "agents": "scan_agents",
+}
+
+# Valid entry scopes, in the order get_stats reports them
+_SCOPES = ("global", "project", "local")
+
+# Singular element type (as used by show) -> catalog type
+_SINGULAR_TO_PLURAL = {
+    "skill": "skills",
+    "command": "commands",
+    "agent": "agents",
+}
+
+# Catalog file identity used to validate in-memory caches: (mtime_ns, size)
+StatKey = Tuple[int, int]
+
+# Fingerprint of the files a sync would scan: path -> [mtime_ns, size]
+Fingerprint = Dict[str, List[int]]
+
+
+def _element_types(element_type: str) -> List[str]:
+    """Expand "all" into every catalog type."""
+    return list(_ENTRY_TYPES) if element_type == "all" else [element_type]
+
+
+def _log_background_sync_error(future: Future) -> None:
+    """Log a failed background sync; list() has already returned, so nothing can raise it."""
+    if future.cancelled():
+        return
+    error = future.exception()
+    if error is not None:
+        logger.warning(f"Background catalog sync failed: {error}")
+
+
+@lru_cache(maxsize=None)
+def _entry_list_adapter(entry_cls: Type[CatalogEntry]) -> TypeAdapter:
+    """Build (once) the validator for a whole catalog's entry list."""
+    return TypeAdapter(List[entry_cls])  # type: ignore[valid-type]
+
 
 class CatalogManager:
     """
@@ -32,6 +109,9 @@ class CatalogManager:
     - Getting statistics
     """
 
+    # Seconds a catalog counts as fresh enough to skip a background refresh
+    AUTO_SYNC_TTL = 60
+
     def __init__(self, manifests_dir: Optional[Path] = None):
         """
         Initialize CatalogManager.
@@ -52,11 +132,26 @@ class CatalogManager:
         self.manifests_dir = manifests_dir
         self.manifests_dir.mkdir(parents=True, exist_ok=True)
 
+        # Background refreshes for list(); the lock keeps syncs from overlapping
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._sync_lock = threading.Lock()
+        self._pending_sync: Optional[Future] = None
+
+        # Parsed catalogs per element type, reused while the file is unchanged,
+        # with their per-scope partitions filled in on first use
+        self._catalog_cache: Dict[
+            str, Tuple[StatKey, List[CatalogEntry], Dict[str, List[CatalogEntry]]]
+        ] = {}
+        # Raw entries by name per element type, for show()
+        self._name_index: Dict[str, Tuple[StatKey, Dict[str, List[Dict[str, Any]]]]] = {}
+
+        self._prefetch_catalogs()
+
     def list(
         self,
         element_type: str,
         scope: str = "all",
-        auto_sync: bool = True,
+        auto_sync: Union[bool, str] = "background",
     ) -> List[CatalogEntry]:
         """
         List catalog entries with optional auto-sync.
@@ -66,7 +161,10 @@ class CatalogManager:
                          ("skills", "commands", "agents", or "all")
             scope: Scope filter
                   ("global", "project", "local", or "all")
-            auto_sync: Whether to auto-sync before listing (default: True)
+            auto_sync: True to sync before listing, False to skip syncing, or
+                      "background" (default) to return the current catalog and
+                      refresh it in the background (stale-while-revalidate).
+                      A catalog that does not exist yet is always synced first.
 
         Returns:
             List of catalog entries
@@ -75,17 +173,19 @@ class CatalogManager:
             >>> manager = CatalogManager()
             >>> skills = manager.list("skills", scope="global")
         """
+        if auto_sync == "background" and self._catalogs_exist(element_type):
+            # Serve the current catalog, then refresh it if it is stale
+            entries = self._load_catalog(element_type, scope)
+            if not self._is_fresh(element_type):
+                self._pending_sync = self._executor.submit(self.sync, element_type)
+                self._pending_sync.add_done_callback(_log_background_sync_error)
+            return entries
+
         if auto_sync:
             self.sync(element_type)
 
-        # Load from catalog
-        entries = self._load_catalog(element_type)
-
-        # Filter by scope
-        if scope != "all":
-            entries = self.searcher.filter_by_scope(entries, scope)
-
-        return entries
+        # Load from catalog, filtered by scope
+        return self._load_catalog(element_type, scope)
 
     def search(
         self,
@@ -110,18 +210,12 @@ class CatalogManager:
             >>> manager = CatalogManager()
             >>> results = manager.search("python")
         """
-        # Load catalogs
-        entries = self._load_catalog(element_type)
+        # Load catalogs, filtered by scope before the (costlier) text search
+        entries = self._load_catalog(element_type, scope)
 
         # Search
         search_results = self.searcher.search(entries, query)
-        entries = [entry for entry, _ in search_results]
-
-        # Filter by scope
-        if scope != "all":
-            entries = self.searcher.filter_by_scope(entries, scope)
-
-        return entries
+        return [entry for entry, _ in search_results]
 
     def show(
         self,
@@ -144,13 +238,18 @@ class CatalogManager:
             >>> manager = CatalogManager()
             >>> skill = manager.show("skill", "python-tester")
         """
-        entries = self._load_catalog(self._pluralize_type(element_type))
-
-        # Find matching entry
-        for entry in entries:
-            if entry.name == name:
-                if scope is None or entry.scope == scope:
-                    return entry
+        etype = self._pluralize_type(element_type)
+        entry_cls = _ENTRY_TYPES.get(etype)
+        if entry_cls is None:
+            return None
+
+        # Find matching entry, building a model only for the match
+        for entry_data in self._get_name_index(etype).get(name, []):
+            if scope is None or entry_data.get("scope") == scope:
+                try:
+                    return entry_cls(**entry_data)
+                except ValidationError:
+                    continue
 
         return None
 
@@ -166,28 +265,46 @@ class CatalogManager:
             >>> manager = CatalogManager()
             >>> manager.sync("all")
         """
-        types_to_sync = (
-            ["skills", "commands", "agents"] if element_type == "all" else [element_type]
-        )
+        types_to_sync = _element_types(element_type)
 
-        for etype in types_to_sync:
+        with self._sync_lock:
             # Get scope paths
             scope_paths = self._get_scope_paths()
 
-            # Scan filesystem and sync
-            catalog_path = self.manifests_dir / f"{etype}.json"
-            discovered_entries: List[CatalogEntry]
-            if etype == "skills":
-                discovered_entries = cast(List[CatalogEntry], self.scanner.scan_skills(scope_paths))
-            elif etype == "commands":
-                discovered_entries = cast(
-                    List[CatalogEntry], self.scanner.scan_commands(scope_paths)
-                )
-            elif etype == "agents":
-                discovered_entries = cast(List[CatalogEntry], self.scanner.scan_agents(scope_paths))
+            # Types are independent and their scans I/O-bound, so sync them concurrently
+            if len(types_to_sync) == 1:
+                self._sync_type(types_to_sync[0], scope_paths)
             else:
-                continue
-            self.syncer.sync(catalog_path, discovered_entries)
+                with ThreadPoolExecutor(max_workers=len(types_to_sync)) as executor:
+                    list(executor.map(self._sync_type, types_to_sync, repeat(scope_paths)))
+
+    def _sync_type(self, etype: str, scope_paths: List[Path]) -> None:
+        """
+        Synchronize one element type's catalog with the filesystem.
+
+        Args:
+            etype: Type to sync ("skills", "commands", or "agents")
+            scope_paths: Scope paths to scan
+        """
+        scan_method = _SCAN_METHODS.get(etype)
+        if scan_method is None:
+            return
+
+        # Skip the scan when no scanned file changed since the last sync
+        catalog_path = self.manifests_dir / f"{etype}.json"
+        index_path = self.manifests_dir / f"{etype}.index.json"
+        fingerprint = self._fingerprint(etype, scope_paths)
+        if catalog_path.exists() and self._read_index(index_path) == fingerprint:
+            # Mark the catalog as verified for the auto-sync TTL
+            os.utime(index_path)
+            return
+
+        # Scan filesystem and sync
+        discovered_entries: List[CatalogEntry] = getattr(self.scanner, scan_method)(scope_paths)
+        self.syncer.sync(catalog_path, discovered_entries)
+        self._write_index(index_path, fingerprint)
+        self._catalog_cache.pop(etype, None)
+        self._name_index.pop(etype, None)
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -202,75 +319,273 @@ class CatalogManager:
             >>> print(stats["total"])
         """
         by_type: Dict[str, int] = {}
-        by_scope: Dict[str, int] = {
-            "global": 0,
-            "project": 0,
-            "local": 0,
-        }
-        total = 0
-
-        for element_type in ["skills", "commands", "agents"]:
-            entries = self._load_catalog(element_type)
-            count = len(entries)
+        by_scope: Dict[str, int] = dict.fromkeys(_SCOPES, 0)
+        scope_counts: Counter = Counter()
 
-            total += count
-            by_type[element_type] = count
+        # Count raw scopes as they are read; no model is needed for totals.
+        # Entries with an unknown scope would fail validation, so list() never
+        # returns them and they are not counted either.
+        for element_type in _ENTRY_TYPES:
+            counted = scope_counts.total()
+            scopes = map(dict.get, self._iter_catalog_raw(element_type), repeat("scope"))
+            scope_counts.update(scope for scope in scopes if scope in _SCOPES)
+            by_type[element_type] = scope_counts.total() - counted
 
-            for entry in entries:
-                by_scope[entry.scope] = by_scope.get(entry.scope, 0) + 1
+        by_scope.update(scope_counts)
 
         return {
-            "total": total,
+            "total": scope_counts.total(),
             "by_type": by_type,
             "by_scope": by_scope,
         }
 
-    def _load_catalog(self, element_type: str) -> List[CatalogEntry]:
+    def _load_catalog(self, element_type: str, scope: str = "all") -> List[CatalogEntry]:
         """
         Load entries from catalog file(s).
 
         Args:
             element_type: Type to load
                          ("skills", "commands", "agents", or "all")
+            scope: Scope filter
+                  ("global", "project", "local", or "all")
 
         Returns:
             List of catalog entries
         """
         entries: List[CatalogEntry] = []
 
-        types_to_load = (
-            ["skills", "commands", "agents"] if element_type == "all" else [element_type]
-        )
+        types_to_load = _element_types(element_type)
 
         for etype in types_to_load:
-            catalog_path = self.manifests_dir / f"{etype}.json"
-            if not catalog_path.exists():
+            entry_cls = _ENTRY_TYPES.get(etype)
+            if entry_cls is None:
+                continue
+
+            # Reuse the parsed catalog while the file is unchanged
+            stat_key = self._stat_catalog(etype)
+            cached = self._catalog_cache.get(etype)
+            if cached is None or stat_key is None or cached[0] != stat_key:
+                cached = (stat_key, self._parse_catalog(etype, entry_cls), {})
+                if stat_key is not None:
+                    self._catalog_cache[etype] = cached
+            _, etype_entries, partitions = cached
+
+            if scope == "all":
+                entries.extend(etype_entries)
                 continue
 
+            # Partition by scope once per cached catalog
+            if scope not in partitions:
+                partitions[scope] = self.searcher.filter_by_scope(etype_entries, scope)
+            entries.extend(partitions[scope])
+
+        return entries
+
+    def _parse_catalog(self, etype: str, entry_cls: Type[CatalogEntry]) -> List[CatalogEntry]:
+        """
+        Parse and validate every entry of one catalog file.
+
+        Args:
+            etype: Type to parse ("skills", "commands", or "agents")
+            entry_cls: Model class of the catalog's entries
+
+        Returns:
+            List of catalog entries (empty if the catalog is corrupted)
+        """
+        # Validate the catalog's entries in one pydantic-core call;
+        # model_construct() is not used as it is no faster per row
+        try:
+            return cast(
+                List[CatalogEntry],
+                _entry_list_adapter(entry_cls).validate_python(list(self._iter_catalog_raw(etype))),
+            )
+        except ValidationError as e:
+            # _iter_catalog_raw absorbs read and decode errors and yields only
+            # entry dicts, so invalid entries are the one failure left here
+            logger.debug(f"Skipping invalid {etype} catalog: {e}")
+            return []
+
+    def _get_name_index(self, etype: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get raw catalog entries grouped by name, in catalog order.
+
+        The index is built on first use and reused while the file is unchanged.
+
+        Args:
+            etype: Type to index ("skills", "commands", or "agents")
+
+        Returns:
+            Mapping of element name to its raw entry dicts
+        """
+        stat_key = self._stat_catalog(etype)
+        cached = self._name_index.get(etype)
+        if cached is not None and stat_key is not None and cached[0] == stat_key:
+            return cached[1]
+
+        index: Dict[str, List[Dict[str, Any]]] = {}
+        for entry_data in self._iter_catalog_raw(etype):
+            name = entry_data.get("name")
+            # Names that are not strings (possibly unhashable) can never validate
+            if isinstance(name, str):
+                index.setdefault(name, []).append(entry_data)
+
+        if stat_key is not None:
+            self._name_index[etype] = (stat_key, index)
+        return index
+
+    def _prefetch_catalogs(self) -> None:
+        """
+        Ask the kernel to start reading the catalog files ahead of use.
+
+        posix_fadvise(WILLNEED) returns immediately and the readahead runs
+        while the caller is still setting up, so the first load finds the
+        files in the page cache. A no-op where posix_fadvise is unavailable
+        (Windows, macOS).
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+
+        for etype in _ENTRY_TYPES:
             try:
-                import json
-
-                data = json.loads(catalog_path.read_text())
-
-                for entry_data in data.get("entries", []):
-                    # Deserialize based on type
-                    entry: CatalogEntry
-                    if etype == "skills":
-                        entry = SkillCatalogEntry(**entry_data)
-                    elif etype == "commands":
-                        entry = CommandCatalogEntry(**entry_data)
-                    elif etype == "agents":
-                        entry = AgentCatalogEntry(**entry_data)
-                    else:
-                        continue
+                fd = os.open(self.manifests_dir / f"{etype}.json", os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+
+    def _stat_catalog(self, etype: str) -> Optional[StatKey]:
+        """Get the (mtime_ns, size) of a catalog file, or None if it is missing."""
+        try:
+            stat = os.stat(self.manifests_dir / f"{etype}.json")
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _iter_catalog_raw(self, etype: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the raw entry dicts of one catalog file without building models.
+
+        Missing or unparseable catalogs yield nothing, and entries that are
+        not JSON objects are skipped. Catalogs of at least
+        STREAM_MIN_BYTES are parsed incrementally with ijson, when installed,
+        so only one entry is held at a time; a streamed catalog that turns out
+        to be damaged stops after the last intact entry.
+
+        Args:
+            etype: Type to read ("skills", "commands", or "agents")
+
+        Yields:
+            Entry data dictionaries as stored in the catalog
+        """
+        catalog_path = self.manifests_dir / f"{etype}.json"
+        try:
+            if IJSON_AVAILABLE and catalog_path.stat().st_size >= STREAM_MIN_BYTES:
+                with catalog_path.open("rb") as f:
+                    # use_float keeps numbers as floats rather than Decimals
+                    for entry_data in ijson.items(f, "entries.item", use_float=True):
+                        if isinstance(entry_data, dict):
+                            yield entry_data
+                return
+
+            data = read_catalog_file(catalog_path)
+        except (OSError, ValueError, *_STREAM_ERRORS):
+            return
+
+        entries = data.get("entries") if isinstance(data, dict) else None
+        if isinstance(entries, list):
+            for entry_data in entries:
+                if isinstance(entry_data, dict):
+                    yield entry_data
+
+    def _fingerprint(self, element_type: str, scope_paths: List[Path]) -> Fingerprint:
+        """
+        Stat every file and directory a scan of element_type would read.
+
+        Covers the element directory itself (entries added or removed), each
+        entry in it and, for skills, the SKILL.md inside each skill directory.
 
-                    entries.append(entry)
+        Args:
+            element_type: Type to fingerprint ("skills", "commands", "agents")
+            scope_paths: Scope paths the scanner would walk
+
+        Returns:
+            Mapping of path to [mtime_ns, size]
+        """
+        fingerprint: Fingerprint = {}
 
-            except Exception:
-                # Skip corrupted catalogs
+        for scope_path in scope_paths:
+            # Shares the scanner's cached validation, so scope paths resolve once
+            validated_path = self.scanner._validated_scope(scope_path)[0]
+            element_dir = os.path.join(validated_path, element_type)
+            try:
+                stat = os.stat(element_dir)
+                fingerprint[element_dir] = [stat.st_mtime_ns, stat.st_size]
+                with os.scandir(element_dir) as it:
+                    items = list(it)
+            except OSError:
+                # Missing or unreadable element directory
                 continue
 
-        return entries
+            for item in items:
+                try:
+                    stat = item.stat()
+                except OSError:
+                    # Dangling symlink or entry removed mid-scan: record a sentinel
+                    # so the rest of the directory is still fingerprinted
+                    fingerprint[item.path] = [-1, -1]
+                    continue
+                fingerprint[item.path] = [stat.st_mtime_ns, stat.st_size]
+
+                if element_type == "skills" and item.is_dir():
+                    skill_file = os.path.join(item.path, "SKILL.md")
+                    try:
+                        stat = os.stat(skill_file)
+                    except OSError:
+                        # No SKILL.md, so the scan skips this directory too
+                        continue
+                    fingerprint[skill_file] = [stat.st_mtime_ns, stat.st_size]
+
+        return fingerprint
+
+    def _read_index(self, index_path: Path) -> Optional[Fingerprint]:
+        """Read the fingerprint saved by the last sync, if any."""
+        try:
+            return cast(Fingerprint, json.loads(index_path.read_text()))
+        except (OSError, ValueError):
+            return None
+
+    def _write_index(self, index_path: Path, fingerprint: Fingerprint) -> None:
+        """Atomically save the fingerprint of a completed sync."""
+        temp_fd, temp_path = tempfile.mkstemp(suffix=".json", dir=index_path.parent, text=True)
+        try:
+            with os.fdopen(temp_fd, "w") as f:
+                json.dump(fingerprint, f)
+            os.replace(temp_path, index_path)
+        except OSError:
+            # The index is only an optimization; the next sync rescans
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+    def _catalogs_exist(self, element_type: str) -> bool:
+        """Check whether every catalog file for element_type exists."""
+        types_to_check = _element_types(element_type)
+        return all((self.manifests_dir / f"{etype}.json").exists() for etype in types_to_check)
+
+    def _is_fresh(self, element_type: str) -> bool:
+        """Check whether every catalog for element_type was synced within the TTL."""
+        types_to_check = _element_types(element_type)
+        cutoff = time.time() - self.AUTO_SYNC_TTL
+        try:
+            return all(
+                os.path.getmtime(self.manifests_dir / f"{etype}.index.json") > cutoff
+                for etype in types_to_check
+            )
+        except OSError:
+            return False
 
     def _get_scope_paths(self) -> List[Path]:
         """Get paths to scan for all scopes."""
@@ -290,9 +605,4 @@ class CatalogManager:
 
     def _pluralize_type(self, element_type: str) -> str:
         """Convert singular type to plural."""
-        mapping = {
-            "skill": "skills",
-            "command": "commands",
-            "agent": "agents",
-        }
-        return mapping.get(element_type, element_type)
+        return _SINGULAR_TO_PLURAL.get(element_type, element_type)
@@ -4,16 +4,125 @@ CLI interface for catalog system.
 Provides user-facing commands for catalog management.
 """
 
+import re
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Union
+
 import click
 from tabulate import tabulate  # type: ignore[import-untyped]
 
 from .catalog_manager import CatalogManager
 
+# Column padding tabulate adds around headers
+_MIN_PADDING = 2
+
+# Cells tabulate parses as booleans
+_BOOL_CELLS = frozenset({"True", "False"})
+
+# Strings tabulate parses as numbers besides float() ones, e.g. "1,000"
+_THOUSANDS_NUMBER = re.compile(r"[+-]?(\d{1,3}(,\d{3})+|\d+)(\.\d*)?$")
+
+
+def _is_numeric(cell: str) -> bool:
+    """Check whether tabulate would treat a cell as a number."""
+    try:
+        float(cell)
+        return True
+    except ValueError:
+        return bool(_THOUSANDS_NUMBER.match(cell))
+
+
+def _format_plain_table(rows: List[List[str]], headers: Sequence[str]) -> Optional[str]:
+    """
+    Render rows as tabulate's "simple" format would, for plain text.
+
+    Returns None when tabulate's own handling is needed: no rows, non-ASCII
+    or non-printable text (display widths, multi-line cells), all-numeric
+    columns or columns mixing "True"/"False" with numbers (both
+    right-aligned), or fully blank rows.
+    """
+    if not rows:
+        return None
+
+    for row in rows:
+        if not any(row):
+            return None
+        for cell in row:
+            if not (cell.isascii() and cell.isprintable()):
+                return None
+
+    columns = list(zip(*rows))
+    for column in columns:
+        if all(_is_numeric(cell) or not cell for cell in column):
+            return None
+        # tabulate reads "True"/"False" as booleans, which it aligns like numbers
+        if any(cell in _BOOL_CELLS for cell in column) and any(map(_is_numeric, column)):
+            return None
+
+    widths = [
+        max(len(header) + _MIN_PADDING, max(map(len, column)))
+        for header, column in zip(headers, columns)
+    ]
+    lines = [
+        "  ".join(header.ljust(width) for header, width in zip(headers, widths)).rstrip(),
+        "  ".join("-" * width for width in widths),
+    ]
+    lines.extend(
+        "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in rows
+    )
+    return "\n".join(lines)
+
+
+def format_table(rows: Iterable[Sequence[str]], headers: Sequence[str]) -> str:
+    """
+    Format rows as a "simple" table.
+
+    Plain-text tables are laid out directly, which is much faster than
+    tabulate on large catalogs (tabulate measures every cell's display width);
+    anything else is handed to tabulate.
+
+    Args:
+        rows: Table rows of string cells
+        headers: Column headers
+
+    Returns:
+        The formatted table
+    """
+    rows = list(rows)
+    # tabulate strips surrounding whitespace from cells
+    table = _format_plain_table([[cell.strip() for cell in row] for row in rows], headers)
+    if table is None:
+        table = tabulate(rows, headers=headers, tablefmt="simple")
+    return table
+
+
+def get_manager(ctx: click.Context) -> CatalogManager:
+    """
+    Get the CatalogManager for the current manifests directory.
+
+    One instance is shared by every command run with the same ``obj``, so its
+    parsed-catalog caches survive across commands (e.g. in a REPL or daemon).
+
+    Args:
+        ctx: Click context; managers are kept in ``ctx.obj["catalogs"]``
+
+    Returns:
+        CatalogManager for ``./manifests``
+    """
+    managers = ctx.ensure_object(dict).setdefault("catalogs", {})
+    manifests_dir = (Path.cwd() / "manifests").resolve()
+
+    manager = managers.get(manifests_dir)
+    if manager is None:
+        manager = managers[manifests_dir] = CatalogManager(manifests_dir)
+    return manager
+
 
 @click.group()
-def cli() -> None:
+@click.pass_context
+def cli(ctx: click.Context) -> None:
     """LLM Catalog Management System."""
-    pass
+    ctx.ensure_object(dict)
 
 
 @cli.command(name="list")
@@ -24,21 +133,29 @@ def cli() -> None:
     type=click.Choice(["global", "project", "local", "all"]),
     help="Filter by scope",
 )
-def list_elements(element_type: str, scope: str) -> None:
+@click.option("--force-sync", is_flag=True, help="Sync before listing instead of in the background")
+@click.option("--no-sync", is_flag=True, help="List the current catalog without syncing")
+@click.pass_context
+def list_elements(
+    ctx: click.Context, element_type: str, scope: str, force_sync: bool, no_sync: bool
+) -> None:
     """List catalog elements."""
-    manager = CatalogManager()
-    entries = manager.list(element_type, scope=scope)
+    if force_sync and no_sync:
+        raise click.UsageError("--force-sync and --no-sync are mutually exclusive.")
+
+    auto_sync: Union[bool, str] = True if force_sync else False if no_sync else "background"
+    manager = get_manager(ctx)
+    entries = manager.list(element_type, scope=scope, auto_sync=auto_sync)
 
     if not entries:
         click.echo(f"No {element_type} found.")
         return
 
     # Format as table
-    table_data = [[entry.name, entry.scope, entry.description[:50]] for entry in entries]
+    table_data = ((entry.name, entry.scope, entry.description[:50]) for entry in entries)
     headers = ["Name", "Scope", "Description"]
 
-    click.echo(tabulate(table_data, headers=headers, tablefmt="simple"))
-    click.echo(f"\nTotal: {len(entries)}")
+    click.echo(f"{format_table(table_data, headers)}\n\nTotal: {len(entries)}")
 
 
 @cli.command()
@@ -50,9 +167,10 @@ def list_elements(element_type: str, scope: str) -> None:
     type=click.Choice(["skills", "commands", "agents", "all"]),
     help="Filter by type",
 )
-def search(query: str, element_type: str) -> None:
+@click.pass_context
+def search(ctx: click.Context, query: str, element_type: str) -> None:
     """Search catalog entries."""
-    manager = CatalogManager()
+    manager = get_manager(ctx)
     results = manager.search(query, element_type=element_type)
 
     if not results:
@@ -60,26 +178,22 @@ def search(query: str, element_type: str) -> None:
         return
 
     # Format as table
-    table_data = [
-        [
-            entry.name,
-            entry.scope,
-            type(entry).__name__.replace("CatalogEntry", ""),
-        ]
+    table_data = (
+        (entry.name, entry.scope, type(entry).__name__.replace("CatalogEntry", ""))
         for entry in results
-    ]
+    )
     headers = ["Name", "Scope", "Type"]
 
-    click.echo(tabulate(table_data, headers=headers, tablefmt="simple"))
-    click.echo(f"\nFound {len(results)} results.")
+    click.echo(f"{format_table(table_data, headers)}\n\nFound {len(results)} results.")
 
 
 @cli.command()
 @click.argument("element_type", type=click.Choice(["skill", "command", "agent"]))
 @click.argument("name")
-def show(element_type: str, name: str) -> None:
+@click.pass_context
+def show(ctx: click.Context, element_type: str, name: str) -> None:
     """Show details for a specific element."""
-    manager = CatalogManager()
+    manager = get_manager(ctx)
     entry = manager.show(element_type, name)
 
     if not entry:
@@ -106,9 +220,10 @@ def show(element_type: str, name: str) -> None:
     type=click.Choice(["skills", "commands", "agents", "all"]),
     default="all",
 )
-def sync(element_type: str) -> None:
+@click.pass_context
+def sync(ctx: click.Context, element_type: str) -> None:
     """Synchronize catalogs with filesystem."""
-    manager = CatalogManager()
+    manager = get_manager(ctx)
 
     click.echo(f"Syncing {element_type}...")
     manager.sync(element_type)
@@ -116,9 +231,10 @@ def sync(element_type: str) -> None:
 
 
 @cli.command()
-def stats() -> None:
+@click.pass_context
+def stats(ctx: click.Context) -> None:
     """Show catalog statistics."""
-    manager = CatalogManager()
+    manager = get_manager(ctx)
     statistics = manager.get_stats()
 
     click.echo("\nCatalog Statistics")
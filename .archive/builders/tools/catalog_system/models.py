@@ -8,18 +8,22 @@ This module defines the data models for catalog entries:
 - AgentCatalogEntry: Model for agent catalog entries
 """
 
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import List, Literal
+from typing import Any, List, Literal
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class CatalogEntry(BaseModel):
     """
     Base model for catalog entries.
 
+    Entries are immutable: CatalogManager shares cached instances between
+    callers, so changes go through model_copy(update=...).
+
     Attributes:
         id: Unique identifier (UUID)
         name: Name of the element (1-100 characters)
@@ -27,7 +31,7 @@ class CatalogEntry(BaseModel):
         description: Description of the element (max 500 characters)
         created_at: Timestamp when entry was created
         updated_at: Timestamp when entry was last updated
-        file_path: Path to the element file
+        file_path: Path to the element file (kept as a string; see file_path_obj)
     """
 
     id: UUID = Field(default_factory=uuid4)
@@ -36,7 +40,22 @@ class CatalogEntry(BaseModel):
     description: str = Field(default="", max_length=500)
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
-    file_path: Path
+    file_path: str
+
+    model_config = ConfigDict(frozen=True)
+
+    @field_validator("file_path", mode="before")
+    @classmethod
+    def validate_file_path(cls, v: Any) -> Any:
+        """Accepts Path objects, storing them as strings."""
+        if isinstance(v, os.PathLike):
+            return os.fspath(v)
+        return v
+
+    @property
+    def file_path_obj(self) -> Path:
+        """Element file path as a Path, for callers that touch the file."""
+        return Path(self.file_path)
 
 
 class SkillCatalogEntry(CatalogEntry):
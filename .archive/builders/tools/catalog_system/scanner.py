@@ -19,11 +19,15 @@ Example Usage:
     ...     print(f"{skill.name}: {skill.description}")
 """
 
+import os
 import yaml  # type: ignore[import-untyped]
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional, Sequence, Tuple
 
 from .models import (
+    CatalogEntry,
     SkillCatalogEntry,
     CommandCatalogEntry,
     AgentCatalogEntry,
@@ -37,6 +41,21 @@ try:
 except ImportError:
     VALIDATOR_AVAILABLE = False
 
+# libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Bytes read at a time from the top of a file when looking for frontmatter
+FRONTMATTER_HEAD_BYTES = 4096
+
+# Upper bound on threads used by scan_all
+SCAN_MAX_WORKERS = 8
+
+
+@lru_cache(maxsize=None)
+def _global_claude_dir() -> Path:
+    """Resolved home/.claude directory, looked up once per process."""
+    return (Path.home() / ".claude").resolve()
+
 
 class Scanner:
     """
@@ -81,6 +100,9 @@ class Scanner:
         if validate and not VALIDATOR_AVAILABLE:
             print("Warning: element_validator not available, validation disabled")
 
+        # Validated path and scope per scope path, shared by the scan_* methods
+        self._scope_cache: Dict[Path, Tuple[Path, str]] = {}
+
     def scan_skills(self, scope_paths: List[Path]) -> List[SkillCatalogEntry]:
         """
         Scan for skills in the provided scope paths.
@@ -102,42 +124,39 @@ class Scanner:
         discovered: List[SkillCatalogEntry] = []
 
         for scope_path in scope_paths:
-            # Validate and normalize path
-            validated_path = self._validate_path(scope_path)
+            # Validate and normalize path, and detect scope from it
+            validated_path, scope = self._validated_scope(scope_path)
 
             # Build skills directory path
             skills_dir = validated_path / self.SKILLS_DIR
 
-            # Skip if directory doesn't exist
-            if not skills_dir.exists() or not skills_dir.is_dir():
-                continue
-
-            # Detect scope from path
-            scope = self._detect_scope(validated_path)
-
-            # Scan for skill directories
+            # Scan for skill directories; a missing skills directory raises
+            # OSError, so there is no separate exists()/is_dir() probe
             try:
-                for item in skills_dir.iterdir():
-                    if not item.is_dir():
-                        continue
-
-                    # Look for SKILL.md file
-                    skill_file = item / "SKILL.md"
-                    if not skill_file.exists():
-                        continue
-
-                    # Validate element (skip if invalid and skip_invalid=True)
-                    if not self._validate_element(skill_file, ElementType.SKILL if VALIDATOR_AVAILABLE else None):
-                        continue
-
-                    # Parse frontmatter and create entry
-                    try:
-                        entry = self._create_skill_entry(item, skill_file, scope)
-                        discovered.append(entry)
-                    except Exception:
-                        # Log error but continue scanning
-                        # In production, would use proper logging
-                        continue
+                with os.scandir(skills_dir) as it:
+                    for item in it:
+                        # DirEntry.is_dir() answers from the readdir d_type, no stat
+                        if not item.is_dir():
+                            continue
+
+                        # Look for SKILL.md file
+                        skill_file_path = os.path.join(item.path, "SKILL.md")
+                        if not os.path.exists(skill_file_path):
+                            continue
+                        skill_file = Path(skill_file_path)
+
+                        # Validate element (skip if invalid and skip_invalid=True)
+                        if not self._validate_element(skill_file, ElementType.SKILL if VALIDATOR_AVAILABLE else None):
+                            continue
+
+                        # Parse frontmatter and create entry
+                        try:
+                            entry = self._create_skill_entry(skill_file.parent, skill_file, scope)
+                            discovered.append(entry)
+                        except Exception:
+                            # Log error but continue scanning
+                            # In production, would use proper logging
+                            continue
 
             except PermissionError:
                 # Handle permission errors gracefully
@@ -169,36 +188,32 @@ class Scanner:
         discovered: List[CommandCatalogEntry] = []
 
         for scope_path in scope_paths:
-            # Validate and normalize path
-            validated_path = self._validate_path(scope_path)
+            # Validate and normalize path, and detect scope from it
+            validated_path, scope = self._validated_scope(scope_path)
 
             # Build commands directory path
             commands_dir = validated_path / self.COMMANDS_DIR
 
-            # Skip if directory doesn't exist
-            if not commands_dir.exists() or not commands_dir.is_dir():
-                continue
-
-            # Detect scope from path
-            scope = self._detect_scope(validated_path)
-
-            # Scan for command files
+            # Scan for command files; a missing commands directory raises OSError
             try:
-                for item in commands_dir.iterdir():
-                    if not item.is_file() or item.suffix != ".md":
-                        continue
-
-                    # Validate element (skip if invalid and skip_invalid=True)
-                    if not self._validate_element(item, ElementType.COMMAND if VALIDATOR_AVAILABLE else None):
-                        continue
-
-                    # Parse frontmatter and create entry
-                    try:
-                        entry = self._create_command_entry(item, scope)
-                        discovered.append(entry)
-                    except Exception:
-                        # Log error but continue scanning
-                        continue
+                with os.scandir(commands_dir) as it:
+                    for item in it:
+                        # DirEntry.is_file() answers from the readdir d_type, no stat
+                        if not item.name.endswith(".md") or not item.is_file():
+                            continue
+                        command_file = Path(item.path)
+
+                        # Validate element (skip if invalid and skip_invalid=True)
+                        if not self._validate_element(command_file, ElementType.COMMAND if VALIDATOR_AVAILABLE else None):
+                            continue
+
+                        # Parse frontmatter and create entry
+                        try:
+                            entry = self._create_command_entry(command_file, scope)
+                            discovered.append(entry)
+                        except Exception:
+                            # Log error but continue scanning
+                            continue
 
             except PermissionError:
                 continue
@@ -228,36 +243,32 @@ class Scanner:
         discovered: List[AgentCatalogEntry] = []
 
         for scope_path in scope_paths:
-            # Validate and normalize path
-            validated_path = self._validate_path(scope_path)
+            # Validate and normalize path, and detect scope from it
+            validated_path, scope = self._validated_scope(scope_path)
 
             # Build agents directory path
             agents_dir = validated_path / self.AGENTS_DIR
 
-            # Skip if directory doesn't exist
-            if not agents_dir.exists() or not agents_dir.is_dir():
-                continue
-
-            # Detect scope from path
-            scope = self._detect_scope(validated_path)
-
-            # Scan for agent files
+            # Scan for agent files; a missing agents directory raises OSError
             try:
-                for item in agents_dir.iterdir():
-                    if not item.is_file() or item.suffix != ".md":
-                        continue
-
-                    # Validate element (skip if invalid and skip_invalid=True)
-                    if not self._validate_element(item, ElementType.AGENT if VALIDATOR_AVAILABLE else None):
-                        continue
-
-                    # Parse frontmatter and create entry
-                    try:
-                        entry = self._create_agent_entry(item, scope)
-                        discovered.append(entry)
-                    except Exception:
-                        # Log error but continue scanning
-                        continue
+                with os.scandir(agents_dir) as it:
+                    for item in it:
+                        # DirEntry.is_file() answers from the readdir d_type, no stat
+                        if not item.name.endswith(".md") or not item.is_file():
+                            continue
+                        agent_file = Path(item.path)
+
+                        # Validate element (skip if invalid and skip_invalid=True)
+                        if not self._validate_element(agent_file, ElementType.AGENT if VALIDATOR_AVAILABLE else None):
+                            continue
+
+                        # Parse frontmatter and create entry
+                        try:
+                            entry = self._create_agent_entry(agent_file, scope)
+                            discovered.append(entry)
+                        except Exception:
+                            # Log error but continue scanning
+                            continue
 
             except PermissionError:
                 continue
@@ -266,6 +277,70 @@ class Scanner:
 
         return discovered
 
+    def scan_all(self, scope_paths: List[Path]) -> Dict[str, List[CatalogEntry]]:
+        """
+        Scan for skills, commands, and agents in the provided scope paths.
+
+        Each (element type, scope path) pair is scanned in its own thread;
+        the scans are dominated by directory listings and file reads, which
+        release the GIL. Results keep the order of scope_paths.
+
+        Args:
+            scope_paths: List of paths to .claude directories to scan
+
+        Returns:
+            Mapping of "skills", "commands" and "agents" to their entries
+
+        Raises:
+            ScanError: If path validation fails or scanning encounters errors
+
+        Example:
+            >>> scanner = Scanner()
+            >>> found = scanner.scan_all([Path.home() / ".claude"])
+            >>> print(len(found["skills"]))
+        """
+        scans: Dict[str, Callable[[List[Path]], Sequence[CatalogEntry]]] = {
+            "skills": self.scan_skills,
+            "commands": self.scan_commands,
+            "agents": self.scan_agents,
+        }
+        tasks = [(etype, scope_path) for etype in scans for scope_path in scope_paths]
+
+        discovered: Dict[str, List[CatalogEntry]] = {etype: [] for etype in scans}
+        if not tasks:
+            return discovered
+
+        with ThreadPoolExecutor(max_workers=min(SCAN_MAX_WORKERS, len(tasks))) as executor:
+            results = executor.map(lambda task: scans[task[0]]([task[1]]), tasks)
+            for (etype, _), entries in zip(tasks, results):
+                discovered[etype].extend(entries)
+
+        return discovered
+
+    def _validated_scope(self, scope_path: Path) -> Tuple[Path, str]:
+        """
+        Validate a scope path and detect its scope, once per scope path.
+
+        Resolving the path is the costly part of validation, and scanning
+        every element type visits the same scope paths, so the result is
+        cached on the Scanner. Invalid paths are not cached and raise again.
+
+        Args:
+            scope_path: Path to a .claude directory
+
+        Returns:
+            (validated path, scope) tuple
+
+        Raises:
+            ScanError: If path is invalid or dangerous
+        """
+        cached = self._scope_cache.get(scope_path)
+        if cached is None:
+            validated_path = self._validate_path(scope_path)
+            cached = (validated_path, self._detect_scope(validated_path))
+            self._scope_cache[scope_path] = cached
+        return cached
+
     def _validate_path(self, path: Path) -> Path:
         """
         Validate and normalize a path for security.
@@ -304,7 +379,7 @@ class Scanner:
         Detect scope (global/project/local) from path.
 
         Detection logic:
-        - If path is directly under home/.claude: global
+        - If path is home/.claude or under it: global
         - Otherwise: project
         - Local scope requires additional context (settings.local.json)
 
@@ -314,30 +389,20 @@ class Scanner:
         Returns:
             Scope string: "global", "project", or "local"
         """
-        home = Path.home()
-        global_claude = home / ".claude"
-
-        # Check if path is the global .claude directory
-        try:
-            # If path is global_claude or a direct child of it
-            if path == global_claude or path.parent == global_claude:
-                return "global"
-        except (ValueError, OSError):
-            pass
-
-        # Check if path is under home/.claude
-        try:
-            path.relative_to(global_claude)
+        # Paths reaching here are resolved by _validate_path, so compare against
+        # the resolved global directory (~/.claude may be a symlink)
+        if path.is_relative_to(_global_claude_dir()):
             return "global"
-        except ValueError:
-            # Not under home/.claude, must be project
-            return "project"
+
+        # Not under home/.claude, must be project
+        return "project"
 
     def _parse_frontmatter(self, file_path: Path) -> Dict[str, Any]:
         """
         Parse YAML frontmatter from a Markdown file.
 
-        Expects frontmatter delimited by --- at start of file.
+        Expects frontmatter delimited by --- at start of file and closed by
+        a --- at the start of a line.
 
         Args:
             file_path: Path to Markdown file
@@ -346,27 +411,36 @@ class Scanner:
             Dictionary of frontmatter data, empty dict if parsing fails
         """
         try:
-            content = file_path.read_text(encoding="utf-8")
+            # Frontmatter sits at the top of the file, so read only the head
+            with open(file_path, "rb") as f:
+                head = bytearray(f.read(FRONTMATTER_HEAD_BYTES))
+
+                # Check for frontmatter
+                if not head.startswith(b"---"):
+                    return {}
+
+                # Stream further chunks only until the closing delimiter shows up;
+                # the body after it is never read
+                end = head.find(b"\n---", 3)
+                while end < 0:
+                    chunk = f.read(FRONTMATTER_HEAD_BYTES)
+                    if not chunk:
+                        return {}
+                    # Re-scan the tail in case the delimiter straddles chunks
+                    start = max(3, len(head) - 3)
+                    head += chunk
+                    end = head.find(b"\n---", start)
+
+            # Decode only the block between the delimiters; YAML ignores the
+            # surrounding whitespace and loads an empty block as None
+            frontmatter_str = head[3:end].decode("utf-8")
         except (OSError, UnicodeDecodeError):
             # Handle file read errors or encoding issues
             return {}
 
-        # Check for frontmatter
-        if not content.startswith("---"):
-            return {}
-
-        # Split on --- delimiters
-        parts = content.split("---", 2)
-        if len(parts) < 3:
-            return {}
-
-        frontmatter_str = parts[1].strip()
-        if not frontmatter_str:
-            return {}
-
         # Parse YAML
         try:
-            return yaml.safe_load(frontmatter_str) or {}
+            return yaml.load(frontmatter_str, Loader=_YAML_LOADER) or {}
         except yaml.YAMLError:
             # Return empty dict on YAML parse error
             return {}
@@ -394,14 +468,14 @@ class Scanner:
         template = frontmatter.get("template", "basic")
         allowed_tools = frontmatter.get("allowed-tools", [])
 
-        # Check for scripts directory
-        has_scripts = (skill_dir / "scripts").exists()
-
-        # Count files in directory
+        # Count files in directory and check for scripts with one listing
         try:
-            file_count = len(list(skill_dir.iterdir()))
+            names = os.listdir(skill_dir)
+            file_count = len(names)
+            has_scripts = "scripts" in names
         except (OSError, PermissionError):
             file_count = 1
+            has_scripts = False
 
         # Create entry
         return SkillCatalogEntry(
@@ -6,6 +6,7 @@ Uses atomic write pattern for data safety.
 """
 
 import json
+import mmap
 import os
 import shutil
 import tempfile
@@ -13,6 +14,8 @@ from pathlib import Path
 from typing import List, Dict, Any
 from datetime import datetime
 
+from pydantic_core import to_jsonable_python
+
 from .models import (
     CatalogEntry,
     SkillCatalogEntry,
@@ -21,6 +24,61 @@ from .models import (
 )
 from .exceptions import SyncError
 
+# Prefer orjson for catalog (de)serialization; stdlib json is the fallback
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Catalog files at least this large are memory-mapped instead of read()
+MMAP_MIN_BYTES = 64 * 1024
+
+
+def loads_catalog(raw: bytes) -> Any:
+    """Deserialize catalog JSON bytes (raises json.JSONDecodeError on bad input)."""
+    if ORJSON_AVAILABLE:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def read_catalog_file(catalog_path: Path) -> Any:
+    """
+    Read and deserialize a catalog file.
+
+    Large catalogs are memory-mapped and handed to orjson as a memoryview,
+    so the file contents are never copied into a separate bytes object.
+
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    with open(catalog_path, "rb") as f:
+        if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size >= MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    return orjson.loads(view)
+                finally:
+                    # The mmap cannot close while a view is still exported
+                    view.release()
+        return loads_catalog(f.read())
+
+
+def dumps_catalog(catalog_data: Dict[str, Any]) -> bytes:
+    """
+    Serialize catalog data to indented JSON bytes.
+
+    orjson encodes UUIDs and datetimes natively, so entries can be dumped in
+    Python mode; Paths and anything else go through pydantic's JSON conversion.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(catalog_data, default=to_jsonable_python, option=orjson.OPT_INDENT_2)
+    return json.dumps(catalog_data, indent=2, default=to_jsonable_python).encode("utf-8")
+
 
 class Syncer:
     """
@@ -99,7 +157,7 @@ class Syncer:
             return []
 
         try:
-            data = json.loads(catalog_path.read_text())
+            data = read_catalog_file(catalog_path)
 
             entries = []
             for entry_data in data.get("entries", []):
@@ -144,7 +202,7 @@ class Syncer:
                 shutil.copy2(catalog_path, backup_path)
 
             # Serialize entries
-            entries_data = [entry.model_dump(mode="json") for entry in entries]
+            entries_data = [entry.model_dump() for entry in entries]
 
             catalog_data = {
                 "schema_version": "1.0",
@@ -156,12 +214,11 @@ class Syncer:
             temp_fd, temp_path = tempfile.mkstemp(
                 suffix=".json",
                 dir=catalog_path.parent,
-                text=True,
             )
 
             try:
-                with os.fdopen(temp_fd, "w") as f:
-                    json.dump(catalog_data, f, indent=2)
+                with os.fdopen(temp_fd, "wb") as f:
+                    f.write(dumps_catalog(catalog_data))
 
                 # Atomic rename
                 Path(temp_path).replace(catalog_path)
@@ -216,10 +273,11 @@ class Syncer:
             key = (disc_entry.name, disc_entry.scope)
 
             if key in existing_map:
-                # Entry exists - preserve ID and created_at
+                # Entry exists - preserve ID and created_at (entries are frozen)
                 existing_entry = existing_map[key]
-                disc_entry.id = existing_entry.id
-                disc_entry.created_at = existing_entry.created_at
+                disc_entry = disc_entry.model_copy(
+                    update={"id": existing_entry.id, "created_at": existing_entry.created_at}
+                )
                 # updated_at will be set by model
 
             merged.append(disc_entry)